@@ -1,6 +1,31 @@
+import base64
+import mmap
 import os
+import re
 import time
-from typing import List
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Tuple
+
+# Caracteres procesados por bloque en get_statistics
+STATS_CHUNK_SIZE = 64 * 1024
+
+# Caracteres leídos por bloque en la conversión masiva de archivos
+FILE_CHUNK_SIZE = 1024 * 1024
+
+# Tramos de caracteres latin-1 y caracteres sueltos fuera de ese rango
+LATIN1_RUNS = re.compile("[\x00-\xff]+|[^\x00-\xff]")
+
+
+def _concat_bits(values: List[int], widths: List[int]) -> Tuple[int, int]:
+    """Concatena enteros de los anchos dados uniéndolos por pares: O(n log n) y no O(n²)"""
+    while len(values) > 1:
+        odd = len(values) % 2
+        values = [(high << width) | low
+                  for high, low, width in zip(values[::2], values[1::2], widths[1::2])] + values[-1:] * odd
+        widths = [high + low for high, low in zip(widths[::2], widths[1::2])] + widths[-1:] * odd
+    return values[0], widths[0]
 
 
 class BinaryConverter:
@@ -53,6 +78,39 @@ class BinaryConverter:
         chunks = [hex_string[i:i + 2] for i in range(0, len(hex_string), 2)]
         return "".join(chr(int(chunk, 16)) for chunk in chunks if chunk)
 
+    @staticmethod
+    def text_to_base64(text: str, encoding: str = "utf-8") -> str:
+        """Convierte texto a Base64"""
+        return base64.b64encode(text.encode(encoding)).decode("ascii")
+
+    @staticmethod
+    def base64_to_text(encoded: str, encoding: str = "utf-8") -> str:
+        """Convierte Base64 a texto"""
+        encoded = "".join(encoded.split())
+        return base64.b64decode(encoded, validate=True).decode(encoding)
+
+    @staticmethod
+    def text_to_base32(text: str, encoding: str = "utf-8") -> str:
+        """Convierte texto a Base32"""
+        return base64.b32encode(text.encode(encoding)).decode("ascii")
+
+    @staticmethod
+    def base32_to_text(encoded: str, encoding: str = "utf-8") -> str:
+        """Convierte Base32 a texto"""
+        encoded = "".join(encoded.split()).upper()
+        return base64.b32decode(encoded).decode(encoding)
+
+    @staticmethod
+    def text_to_base85(text: str, encoding: str = "utf-8") -> str:
+        """Convierte texto a Base85"""
+        return base64.b85encode(text.encode(encoding)).decode("ascii")
+
+    @staticmethod
+    def base85_to_text(encoded: str, encoding: str = "utf-8") -> str:
+        """Convierte Base85 a texto"""
+        encoded = "".join(encoded.split())
+        return base64.b85decode(encoded).decode(encoding)
+
     @staticmethod
     def visualize_binary_animation(text: str, delay: float = 0.05):
         """Muestra una animación de conversión a binario"""
@@ -76,17 +134,65 @@ class BinaryConverter:
             time.sleep(delay * 2)
 
     @staticmethod
-    def get_statistics(text: str) -> dict:
-        """Obtiene estadísticas del texto"""
-        binary = BinaryConverter.text_to_binary(text, separator="")
+    def get_statistics(text: str, chunk_size: int = STATS_CHUNK_SIZE) -> dict:
+        """Obtiene estadísticas del texto sin construir la cadena binaria completa"""
+        bits = 0
+        ones = 0
+        transitions = 0
+        out_of_range = 0
+        histogram = [0] * 256
+        previous_bit = None
+
+        for start in range(0, len(text), chunk_size):
+            chunk = text[start:start + chunk_size]
+            try:
+                data = chunk.encode("latin-1")
+                value = int.from_bytes(data, "big")
+                width = len(data) * 8
+            except UnicodeEncodeError:
+                # Caracteres > 255: mismo ancho variable que text_to_binary, max(8, cp.bit_length());
+                # cada tramo latin-1 se convierte de una vez y los demás caracteres van sueltos
+                runs = []
+                values = []
+                widths = []
+                for piece in LATIN1_RUNS.findall(chunk):
+                    code = ord(piece[0])
+                    if code < 256:
+                        runs.append(piece.encode("latin-1"))
+                        values.append(int.from_bytes(runs[-1], "big"))
+                        widths.append(len(piece) * 8)
+                    else:
+                        values.append(code)
+                        widths.append(code.bit_length())
+                data = b"".join(runs)
+                out_of_range += len(chunk) - len(data)
+                value, width = _concat_bits(values, widths)
+
+            for byte, count in Counter(data).items():
+                histogram[byte] += count
+
+            # Popcount del bloque completo como un único entero
+            ones += value.bit_count()
+
+            # Transiciones 0→1 / 1→0 dentro del bloque y en la frontera con el anterior
+            inner_mask = (1 << (width - 1)) - 1
+            transitions += ((value ^ (value >> 1)) & inner_mask).bit_count()
+            first_bit = value >> (width - 1)
+            if previous_bit is not None and previous_bit != first_bit:
+                transitions += 1
+            previous_bit = value & 1
+            bits += width
 
         return {
             "caracteres": len(text),
-            "bits": len(binary),
-            "bytes": len(binary) // 8,
-            "unos": binary.count("1"),
-            "ceros": binary.count("0"),
-            "densidad_unos": (binary.count("1") / len(binary) * 100) if binary else 0
+            "bits": bits,
+            "bytes": bits // 8,
+            "unos": ones,
+            "ceros": bits - ones,
+            "densidad_unos": (ones / bits * 100) if bits else 0,
+            "transiciones": transitions,
+            "histograma_bytes": histogram,
+            "fuera_de_rango": out_of_range
         }
 
     @staticmethod
@@ -111,6 +217,290 @@ class BinaryConverter:
                 print()
 
 
+# Registro de códecs: nombre → funciones y tamaños de bloque para el streaming
+CODECS = {}
+
+# Modo de conversión masiva ("text_to_<códec>" / "<códec>_to_text") → parámetros
+BULK_MODES = {}
+
+
+def register_codec(name: str, label: str, extension: str,
+                   encode_block: int = 1, decode_unit: int = 1,
+                   separator: str = "", byte_codec: bool = False,
+                   bytes_encoder: Optional[Callable] = None):
+    """Registra un códec cuyos métodos son BinaryConverter.text_to_<name> / <name>_to_text
+
+    encode_block: caracteres de entrada que se codifican de forma independiente
+    decode_unit: caracteres codificados que se decodifican de forma independiente
+    byte_codec: el códec trabaja sobre bytes y acepta el parámetro encoding
+    bytes_encoder: función opcional memoryview → bytes usada por convert_file
+    """
+    encoder = f"text_to_{name}"
+    decoder = f"{name}_to_text"
+    # En archivos cada byte se lee como un carácter latin-1
+    file_kwargs = {"encoding": "latin-1"} if byte_codec else {}
+
+    CODECS[name] = {
+        "label": label,
+        "encode": getattr(BinaryConverter, encoder),
+        "decode": getattr(BinaryConverter, decoder)
+    }
+    BULK_MODES[encoder] = {
+        "extension": extension,
+        "unit": encode_block,
+        "strip": False,
+        "separator": separator,
+        "kwargs": file_kwargs,
+        "bytes_encoder": bytes_encoder
+    }
+    BULK_MODES[decoder] = {
+        "extension": ".txt",
+        "unit": decode_unit,
+        "strip": True,
+        "separator": "",
+        "kwargs": file_kwargs,
+        "bytes_encoder": None
+    }
+
+
+def _hex_bytes(view: memoryview) -> bytes:
+    """Equivalente a text_to_hex sobre bytes, sin pasar por str"""
+    return view.hex(" ").upper().encode("ascii")
+
+
+register_codec("binary", "Binario", ".bin", decode_unit=8, separator=" ")
+register_codec("hex", "Hexadecimal", ".hex", decode_unit=2, separator=" ",
+               bytes_encoder=_hex_bytes)
+register_codec("base64", "Base64", ".b64", encode_block=3, decode_unit=4,
+               byte_codec=True, bytes_encoder=base64.b64encode)
+register_codec("base32", "Base32", ".b32", encode_block=5, decode_unit=8,
+               byte_codec=True, bytes_encoder=base64.b32encode)
+register_codec("base85", "Base85", ".b85", encode_block=4, decode_unit=5,
+               byte_codec=True, bytes_encoder=base64.b85encode)
+
+
+def benchmark_codecs(text: str, repeat: int = 5) -> List[dict]:
+    """Mide tamaño relativo y rendimiento de cada códec registrado"""
+    size = len(text.encode("utf-8"))
+    results = []
+
+    for name, codec in CODECS.items():
+        encoded = codec["encode"](text)
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            codec["encode"](text)
+        encode_time = (time.perf_counter() - start) / repeat
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            codec["decode"](encoded)
+        decode_time = (time.perf_counter() - start) / repeat
+
+        results.append({
+            "codec": name,
+            "tamaño": len(encoded),
+            "ratio": (len(encoded) / size) if size else 0,
+            "codificar_mb_s": (size / 1_000_000 / encode_time) if encode_time else 0,
+            "decodificar_mb_s": (size / 1_000_000 / decode_time) if decode_time else 0
+        })
+
+    return results
+
+
+def _convert_chunk(mode: str, chunk: str) -> str:
+    """Convierte un bloque en un proceso trabajador"""
+    return getattr(BinaryConverter, mode)(chunk, **BULK_MODES[mode]["kwargs"])
+
+
+def _iter_views(path: Path, chunk_size: int, unit: int = 1) -> Iterator[memoryview]:
+    """Recorre un archivo mapeado en memoria en porciones múltiplos de unit
+
+    Las porciones son vistas sobre el mmap, sin copiar la entrada.
+    """
+    if os.path.getsize(path) == 0:
+        # mmap no admite archivos vacíos
+        return
+
+    step = max(unit, chunk_size - chunk_size % unit)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        with memoryview(mapped) as view:
+            for start in range(0, len(view), step):
+                piece = view[start:start + step]
+                try:
+                    yield piece
+                finally:
+                    piece.release()
+
+
+def _read_chunks(path: Path, mode: str, chunk_size: int) -> Iterator[str]:
+    """Lee un archivo mapeado en memoria por bloques alineados a la unidad del modo"""
+    unit = BULK_MODES[mode]["unit"]
+    strip = BULK_MODES[mode]["strip"]
+
+    if not strip:
+        # Al codificar los cortes del mmap ya están alineados
+        emitted = False
+        for view in _iter_views(path, chunk_size, unit):
+            emitted = True
+            # latin-1 mapea cada byte a un carácter 0-255 y viceversa
+            yield str(view, "latin-1")
+        if not emitted:
+            yield ""
+        return
+
+    # Al decodificar se quitan los espacios y se corta en múltiplos de la unidad
+    pending = ""
+    emitted = False
+    for view in _iter_views(path, chunk_size):
+        pending += "".join(str(view, "latin-1").split())
+        cut = len(pending) - len(pending) % unit
+        if cut:
+            emitted = True
+            yield pending[:cut]
+            pending = pending[cut:]
+
+    # Resto final: grupo corto (Base85) o bits sobrantes
+    if pending or not emitted:
+        yield pending
+
+
+def _iter_tasks(files: List[Tuple[Path, Path]], mode: str,
+                chunk_size: int) -> Iterator[Tuple[int, str]]:
+    """Genera (índice de archivo, bloque) en orden para todos los archivos"""
+    for index, (source, _) in enumerate(files):
+        for chunk in _read_chunks(source, mode, chunk_size):
+            yield index, chunk
+
+
+def convert_files(files: List[Tuple[Path, Path]], mode: str,
+                  workers: Optional[int] = None,
+                  chunk_size: int = FILE_CHUNK_SIZE) -> dict:
+    """Convierte pares (origen, destino) repartiendo bloques en un pool de procesos"""
+    if mode not in BULK_MODES:
+        raise ValueError(f"Modo no válido: {mode}")
+
+    workers = workers or os.cpu_count() or 1
+    separator = BULK_MODES[mode]["separator"]
+    bytes_in = sum(source.stat().st_size for source, _ in files)
+    bytes_out = 0
+    start = time.perf_counter()
+
+    current_index = None
+    output = None
+    needs_separator = False
+
+    def write_result(index: int, result: str):
+        nonlocal current_index, output, needs_separator, bytes_out
+        if index != current_index:
+            if output:
+                output.close()
+            destination = files[index][1]
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            output = open(destination, "w", encoding="latin-1", newline="")
+            current_index = index
+            needs_separator = False
+
+        if needs_separator and result:
+            output.write(separator)
+            bytes_out += len(separator)
+        output.write(result)
+        bytes_out += len(result)
+        needs_separator = needs_separator or bool(result)
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Ventana acotada de tareas en vuelo: memoria constante y salida en orden
+            in_flight = deque()
+            for index, chunk in _iter_tasks(files, mode, chunk_size):
+                in_flight.append((index, executor.submit(_convert_chunk, mode, chunk)))
+                if len(in_flight) >= workers * 2:
+                    done_index, future = in_flight.popleft()
+                    write_result(done_index, future.result())
+
+            while in_flight:
+                done_index, future = in_flight.popleft()
+                write_result(done_index, future.result())
+    finally:
+        if output:
+            output.close()
+
+    elapsed = time.perf_counter() - start
+    return {
+        "archivos": len(files),
+        "bytes_entrada": bytes_in,
+        "bytes_salida": bytes_out,
+        "segundos": elapsed,
+        "mb_por_segundo": (bytes_in / 1_000_000 / elapsed) if elapsed else 0,
+        "procesos": workers
+    }
+
+
+def convert_file(source: str, destination: str, mode: str,
+                 chunk_size: int = FILE_CHUNK_SIZE) -> dict:
+    """Convierte un archivo en este proceso leyendo porciones de un mmap
+
+    Si el códec tiene bytes_encoder, cada porción del mmap se codifica
+    directamente al archivo de salida sin crear cadenas intermedias.
+    """
+    if mode not in BULK_MODES:
+        raise ValueError(f"Modo no válido: {mode}")
+
+    settings = BULK_MODES[mode]
+    separator = settings["separator"].encode("latin-1")
+    bytes_in = os.path.getsize(source)
+    bytes_out = 0
+    start = time.perf_counter()
+
+    Path(destination).parent.mkdir(parents=True, exist_ok=True)
+    with open(destination, "wb") as output:
+        if settings["bytes_encoder"]:
+            pieces = (settings["bytes_encoder"](view)
+                      for view in _iter_views(Path(source), chunk_size, settings["unit"]))
+        else:
+            pieces = (_convert_chunk(mode, chunk).encode("latin-1")
+                      for chunk in _read_chunks(Path(source), mode, chunk_size))
+
+        needs_separator = False
+        for piece in pieces:
+            if needs_separator and piece:
+                output.write(separator)
+                bytes_out += len(separator)
+            output.write(piece)
+            bytes_out += len(piece)
+            needs_separator = needs_separator or bool(piece)
+
+    elapsed = time.perf_counter() - start
+    return {
+        "archivos": 1,
+        "bytes_entrada": bytes_in,
+        "bytes_salida": bytes_out,
+        "segundos": elapsed,
+        "mb_por_segundo": (bytes_in / 1_000_000 / elapsed) if elapsed else 0,
+        "procesos": 1
+    }
+
+
+def convert_directory(input_dir: str, output_dir: str, mode: str,
+                      workers: Optional[int] = None,
+                      chunk_size: int = FILE_CHUNK_SIZE) -> dict:
+    """Convierte todos los archivos de un directorio conservando su estructura"""
+    if mode not in BULK_MODES:
+        raise ValueError(f"Modo no válido: {mode}")
+
+    source_root = Path(input_dir)
+    target_root = Path(output_dir)
+    extension = BULK_MODES[mode]["extension"]
+
+    files = []
+    for source in sorted(source_root.rglob("*")):
+        if source.is_file():
+            relative = source.relative_to(source_root)
+            files.append((source, target_root / relative.with_name(relative.name + extension)))
+
+    return convert_files(files, mode, workers, chunk_size)
+
+
 def clear_screen():
     """Limpia la pantalla"""
     os.system('cls' if os.name == 'nt' else 'clear')
@@ -142,6 +532,14 @@ def print_menu():
     print("    9. Carácter → Binario (individual)")
     print("    10. Número → Binario")
 
+    print("\n  Archivos:")
+    print("    11. Convertir directorio (paralelo)")
+
+    print("\n  Códecs compactos:")
+    print("    12. Texto → Base64/Base32/Base85")
+    print("    13. Base64/Base32/Base85 → Texto")
+    print("    14. Comparar códecs (tamaño y velocidad)")
+
     print("\n    0. Salir")
 
 
@@ -224,6 +622,18 @@ def option_statistics():
     print(f"  Unos (1): {stats['unos']}")
     print(f"  Ceros (0): {stats['ceros']}")
     print(f"  Densidad de unos: {stats['densidad_unos']:.2f}%")
+    print(f"  Transiciones de bit: {stats['transiciones']}")
+
+    # Bytes más frecuentes
+    top_bytes = sorted(range(256), key=lambda b: stats['histograma_bytes'][b], reverse=True)[:5]
+    print(f"\n  Bytes más frecuentes:")
+    for byte in top_bytes:
+        count = stats['histograma_bytes'][byte]
+        if count:
+            display_char = chr(byte) if chr(byte).isprintable() else "·"
+            print(f"    {byte:>3} (0x{byte:02X}) '{display_char}': {count}")
+    if stats['fuera_de_rango']:
+        print(f"    Caracteres fuera de 0-255: {stats['fuera_de_rango']}")
 
     # Visualización de densidad
     bar_length = 50
@@ -247,6 +657,9 @@ def option_compare():
     print(f"{'Texto':<15} {text:<40} {len(text)} caracteres")
     print(f"{'Binario':<15} {binary[:40]}... {len(binary)} bits")
     print(f"{'Hexadecimal':<15} {hex_val[:40]}... {len(hex_val)} dígitos")
+    for name in ("base64", "base32", "base85"):
+        encoded = CODECS[name]["encode"](text)
+        print(f"{CODECS[name]['label']:<15} {encoded[:40]}... {len(encoded)} caracteres")
 
     print(f"\n💾 Eficiencia:")
     print(f"  Texto: {len(text)} bytes")
@@ -254,6 +667,69 @@ def option_compare():
     print(f"  Hexadecimal: {len(hex_val) // 2} bytes")
 
 
+def choose_codec() -> Optional[str]:
+    """Pide al usuario un códec compacto"""
+    names = [name for name in CODECS if name not in ("binary", "hex")]
+    print("\n🔤 Códecs disponibles:")
+    for i, name in enumerate(names, 1):
+        print(f"    {i}. {CODECS[name]['label']}")
+
+    try:
+        return names[int(input("\n➤ Códec: ")) - 1]
+    except (ValueError, IndexError):
+        print("\n❌ Códec inválido")
+        return None
+
+
+def option_text_to_codec():
+    """Opción: Texto a códec compacto"""
+    name = choose_codec()
+    if name is None:
+        return
+
+    text = input("\n📝 Ingresa el texto: ")
+    encoded = CODECS[name]["encode"](text)
+
+    print("\n✅ RESULTADO:")
+    print(f"\nTexto original: {text}")
+    print(f"{CODECS[name]['label']}: {encoded}")
+
+
+def option_codec_to_text():
+    """Opción: Códec compacto a texto"""
+    name = choose_codec()
+    if name is None:
+        return
+
+    print(f"\n📝 Ingresa el texto en {CODECS[name]['label']}:")
+    encoded = input()
+
+    try:
+        text = CODECS[name]["decode"](encoded)
+        print("\n✅ RESULTADO:")
+        print(f"\n{CODECS[name]['label']}: {encoded}")
+        print(f"Texto: {text}")
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+
+
+def option_benchmark_codecs():
+    """Opción: Comparar tamaño y velocidad de los códecs"""
+    text = input("\n📝 Ingresa el texto (Enter para 1 MB de ejemplo): ")
+    if not text:
+        text = "Lorem ipsum dolor sit amet, ñandú café 123. " * 24000
+
+    results = benchmark_codecs(text)
+
+    print("\n📊 COMPARACIÓN DE CÓDECS:")
+    print(f"\n{'Códec':<15} {'Tamaño':>12} {'Ratio':>8} {'Codif. MB/s':>12} {'Decod. MB/s':>12}")
+    print("-" * 63)
+    for result in results:
+        print(f"{CODECS[result['codec']]['label']:<15} {result['tamaño']:>12} "
+              f"{result['ratio']:>7.2f}x {result['codificar_mb_s']:>12.2f} "
+              f"{result['decodificar_mb_s']:>12.2f}")
+
+
 def option_char_to_binary():
     """Opción: Carácter a binario (individual)"""
     char = input("\n📝 Ingresa un carácter: ")
@@ -301,6 +777,37 @@ def option_number_to_binary():
         print("\n❌ Error: Ingresa un número válido")
 
 
+def option_convert_directory():
+    """Opción: Convertir todos los archivos de un directorio"""
+    modes = list(BULK_MODES)
+    print("\n📁 Modos disponibles:")
+    for i, mode in enumerate(modes, 1):
+        print(f"    {i}. {mode}")
+
+    try:
+        mode = modes[int(input("\n➤ Modo: ")) - 1]
+    except (ValueError, IndexError):
+        print("\n❌ Modo inválido")
+        return
+
+    input_dir = input("📂 Directorio de entrada: ").strip()
+    output_dir = input("📂 Directorio de salida: ").strip()
+
+    if not os.path.isdir(input_dir):
+        print("\n❌ El directorio de entrada no existe")
+        return
+
+    summary = convert_directory(input_dir, output_dir, mode)
+
+    print("\n✅ RESULTADO:")
+    print(f"\n  Archivos: {summary['archivos']}")
+    print(f"  Procesos: {summary['procesos']}")
+    print(f"  Entrada: {summary['bytes_entrada']} bytes")
+    print(f"  Salida: {summary['bytes_salida']} bytes")
+    print(f"  Tiempo: {summary['segundos']:.2f} s")
+    print(f"  Rendimiento: {summary['mb_por_segundo']:.2f} MB/s")
+
+
 def main():
     """Función principal"""
     while True:
@@ -334,6 +841,14 @@ def main():
                 option_char_to_binary()
             elif choice == "10":
                 option_number_to_binary()
+            elif choice == "11":
+                option_convert_directory()
+            elif choice == "12":
+                option_text_to_codec()
+            elif choice == "13":
+                option_codec_to_text()
+            elif choice == "14":
+                option_benchmark_codecs()
             else:
                 print("\n❌ Opción inválida")
 
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import platform
+from datetime import datetime
+
+from binary import BinaryConverter
+from medicion import parse_size, peak_memory, time_call
+
+# Tamaños de entrada (caracteres) de 1 KB a 100 MB
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000]
+
+# Patrones repetidos hasta el tamaño pedido
+TEXT_KINDS = {
+    "ascii": "The quick brown fox jumps over the lazy dog 0123456789. ",
+    "latin1": "Canción, niño, pingüino, café crème à la façon ÆØÅ ¿¡ ",
+    "emoji": "🚀🔥 hola 😀👍🏽 mundo 🎉✨ ",
+}
+
+
+def make_text(kind: str, size: int) -> str:
+    """Genera un texto de exactamente size caracteres"""
+    pattern = TEXT_KINDS[kind]
+    return (pattern * (size // len(pattern) + 1))[:size]
+
+
+# Funciones a medir y cómo preparar su entrada a partir del texto (None = el texto tal cual)
+CASES = {
+    "text_to_binary": (BinaryConverter.text_to_binary, None),
+    "binary_to_text": (BinaryConverter.binary_to_text, BinaryConverter.text_to_binary),
+    "text_to_hex": (BinaryConverter.text_to_hex, None),
+    "hex_to_text": (BinaryConverter.hex_to_text, BinaryConverter.text_to_hex),
+    "get_statistics": (BinaryConverter.get_statistics, None),
+}
+
+
+def run_benchmark(sizes, kinds, functions=None, min_time: float = 0.5,
+                  max_repeat: int = 20, measure_memory: bool = True) -> dict:
+    """Ejecuta todas las combinaciones y devuelve el informe"""
+    results = []
+
+    for kind in kinds:
+        for size in sizes:
+            text = make_text(kind, size)
+            input_bytes = len(text.encode("utf-8"))
+
+            for name, (func, prepare) in CASES.items():
+                if functions and name not in functions:
+                    continue
+
+                # Sólo se construye la entrada de las funciones elegidas, una a la vez
+                argument = prepare(text) if prepare else text
+                seconds, repeat = time_call(func, argument, min_time, max_repeat)
+                result = {
+                    "funcion": name,
+                    "texto": kind,
+                    "caracteres": size,
+                    "bytes_utf8": input_bytes,
+                    "entrada_len": len(argument),
+                    "segundos": seconds,
+                    "repeticiones": repeat,
+                    "mb_por_segundo": (input_bytes / 1_000_000 / seconds) if seconds else 0,
+                    "memoria_pico": peak_memory(func, argument) if measure_memory else None
+                }
+                results.append(result)
+                print(f"{name:<16} {kind:<7} {size:>11} car. "
+                      f"{result['mb_por_segundo']:>10.2f} MB/s "
+                      f"{(result['memoria_pico'] or 0) / 1_000_000:>10.2f} MB pico")
+                del argument
+
+            del text
+
+    return {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "resultados": results
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de las conversiones de binary.py")
+    parser.add_argument("--sizes", nargs="+", type=parse_size, default=DEFAULT_SIZES,
+                        help="Tamaños de entrada, p. ej. 1K 1M 100M")
+    parser.add_argument("--kinds", nargs="+", choices=list(TEXT_KINDS), default=list(TEXT_KINDS),
+                        help="Tipos de texto a generar")
+    parser.add_argument("--functions", nargs="+", default=None,
+                        help="Limitar a estas funciones")
+    parser.add_argument("--min-time", type=float, default=0.5,
+                        help="Tiempo mínimo acumulado por medición (s)")
+    parser.add_argument("--max-repeat", type=int, default=20,
+                        help="Repeticiones máximas por medición")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="No medir memoria pico con tracemalloc")
+    parser.add_argument("--output", default="binary_benchmark.json",
+                        help="Archivo JSON de resultados")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.sizes, args.kinds, args.functions,
+                           args.min_time, args.max_repeat, not args.no_memory)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n✓ Resultados guardados en {args.output}")
+
+
+if __name__ == "__main__":
+    main()
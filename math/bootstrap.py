@@ -0,0 +1,150 @@
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+from lotes import DEFAULT_BATCH_ELEMENTS, run_batches
+
+
+# Estadísticos vectorizados: reciben arrays de forma (lote, n) y devuelven (lote,)
+
+def mean(values):
+    return values.mean(axis=1)
+
+
+def mean_difference(first, second):
+    return first.mean(axis=1) - second.mean(axis=1)
+
+
+def _centered_moments(x, y):
+    dx = x - x.mean(axis=1, keepdims=True)
+    dy = y - y.mean(axis=1, keepdims=True)
+    return np.einsum("ij,ij->i", dx, dx), np.einsum("ij,ij->i", dy, dy), np.einsum("ij,ij->i", dx, dy)
+
+
+def slope(x, y):
+    sxx, _, sxy = _centered_moments(x, y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return sxy / sxx
+
+
+def r_squared(x, y):
+    sxx, syy, sxy = _centered_moments(x, y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return sxy * sxy / (sxx * syy)
+
+
+def _resample(arrays, statistic, paired: bool, size: int, rng) -> np.ndarray:
+    """Un lote: matriz de índices (size, n) y el estadístico en una sola operación"""
+    if paired:
+        indices = rng.integers(0, len(arrays[0]), size=(size, len(arrays[0])))
+        return statistic(*(values[indices] for values in arrays))
+    return statistic(*(values[rng.integers(0, len(values), size=(size, len(values)))]
+                       for values in arrays))
+
+
+def _run_task(arrays, sizes: Sequence[int], rng, statistic, paired: bool) -> np.ndarray:
+    return np.concatenate([_resample(arrays, statistic, paired, size, rng) for size in sizes])
+
+
+def bootstrap_distribution(arrays: Sequence[np.ndarray], statistic: Callable,
+                           n_resamples: int = 10_000, paired: bool = True,
+                           workers: Optional[int] = 1, seed: Optional[int] = None,
+                           batch_elements: int = DEFAULT_BATCH_ELEMENTS,
+                           tasks: int = 16) -> np.ndarray:
+    """Distribución bootstrap del estadístico
+
+    paired=True remuestrea las filas de todos los arrays a la vez (p. ej. X e Y);
+    paired=False remuestrea cada array por separado (grupos independientes).
+    Cada tarea recibe un hijo de SeedSequence(seed): el resultado no depende
+    de cuántos procesos se usen.
+    """
+    arrays = tuple(np.asarray(values, dtype=np.float64) for values in arrays)
+    longest = max(len(values) for values in arrays)
+    return np.concatenate(run_batches(_run_task, arrays, n_resamples, longest, (statistic, paired),
+                                      workers, seed, batch_elements, tasks))
+
+
+def _jackknife(arrays, statistic, paired: bool, batch_elements: int) -> np.ndarray:
+    """Estadístico dejando fuera una observación a la vez, por lotes de índices"""
+    values = []
+    groups = [tuple(range(len(arrays)))] if paired else [(i,) for i in range(len(arrays))]
+
+    for group in groups:
+        n = len(arrays[group[0]])
+        base = np.arange(n - 1)
+        step = max(1, batch_elements // max(n - 1, 1))
+        for start in range(0, n, step):
+            left_out = np.arange(start, min(start + step, n))
+            # Fila j: 0..n-1 sin j
+            indices = base[np.newaxis, :] + (base[np.newaxis, :] >= left_out[:, np.newaxis])
+            resampled = []
+            for i, array in enumerate(arrays):
+                if i in group:
+                    resampled.append(array[indices])
+                else:
+                    resampled.append(np.broadcast_to(array, (len(left_out), len(array))))
+            values.append(statistic(*resampled))
+
+    return np.concatenate(values)
+
+
+def bootstrap_ci(arrays: Sequence[np.ndarray], statistic: Callable,
+                 n_resamples: int = 10_000, confidence: float = 0.95,
+                 method: str = "bca", paired: bool = True,
+                 workers: Optional[int] = 1, seed: Optional[int] = None,
+                 batch_elements: int = DEFAULT_BATCH_ELEMENTS) -> dict:
+    """Intervalo de confianza bootstrap por percentiles o BCa"""
+    from scipy.stats import norm
+
+    if method not in ("percentile", "bca"):
+        raise ValueError("method debe ser 'percentile' o 'bca'")
+
+    arrays = tuple(np.asarray(values, dtype=np.float64) for values in arrays)
+    estimate = float(statistic(*(values[np.newaxis, :] for values in arrays))[0])
+    distribution = bootstrap_distribution(arrays, statistic, n_resamples, paired,
+                                          workers, seed, batch_elements)
+    distribution = distribution[np.isfinite(distribution)]
+
+    alpha = (1 - confidence) / 2
+    quantiles = np.array([alpha, 1 - alpha])
+
+    if method == "bca":
+        # Sesgo: proporción de remuestreos bajo la estimación (empates a la mitad)
+        below = np.mean(distribution < estimate) + np.mean(distribution == estimate) / 2
+        z0 = norm.ppf(below)
+
+        # Aceleración: asimetría del jackknife
+        jackknife = _jackknife(arrays, statistic, paired, batch_elements)
+        deviations = jackknife.mean() - jackknife
+        denominator = 6 * np.sum(deviations ** 2) ** 1.5
+        acceleration = np.sum(deviations ** 3) / denominator if denominator else 0.0
+
+        z = norm.ppf(quantiles)
+        quantiles = norm.cdf(z0 + (z0 + z) / (1 - acceleration * (z0 + z)))
+
+    low, high = np.quantile(distribution, quantiles)
+    return {
+        "estimate": estimate,
+        "low": float(low),
+        "high": float(high),
+        "standard_error": float(distribution.std(ddof=1)),
+        "confidence": confidence,
+        "method": method,
+        "n_resamples": len(distribution)
+    }
+
+
+def slope_ci(x, y, **kwargs) -> dict:
+    return bootstrap_ci((x, y), slope, paired=True, **kwargs)
+
+
+def r_squared_ci(x, y, **kwargs) -> dict:
+    return bootstrap_ci((x, y), r_squared, paired=True, **kwargs)
+
+
+def mean_ci(values, **kwargs) -> dict:
+    return bootstrap_ci((values,), mean, paired=True, **kwargs)
+
+
+def mean_difference_ci(first, second, **kwargs) -> dict:
+    return bootstrap_ci((first, second), mean_difference, paired=False, **kwargs)
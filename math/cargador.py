@@ -0,0 +1,111 @@
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+# Filas por bloque: con 2-3 columnas float64 son unas decenas de MB
+DEFAULT_CHUNK_ROWS = 1_000_000
+
+
+def iter_columns(path: str, columns: List[str], chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                 dtype=np.float64, dropna: bool = True) -> Iterator[Dict[str, np.ndarray]]:
+    """Lee sólo las columnas pedidas de un CSV o Parquet en bloques tipados
+
+    Cada bloque es un dict columna → array de NumPy con como mucho chunk_rows filas.
+    Con dropna se descartan las filas con algún valor faltante.
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix in (".parquet", ".pq"):
+        chunks = _iter_parquet(path, columns, chunk_rows)
+    else:
+        chunks = _iter_csv(path, columns, chunk_rows)
+
+    for chunk in chunks:
+        arrays = {name: np.asarray(chunk[name], dtype=dtype) for name in columns}
+        if dropna and np.issubdtype(np.dtype(dtype), np.floating):
+            valid = np.ones(len(arrays[columns[0]]), dtype=bool)
+            for values in arrays.values():
+                valid &= ~np.isnan(values)
+            if not valid.all():
+                arrays = {name: values[valid] for name, values in arrays.items()}
+        if len(arrays[columns[0]]):
+            yield arrays
+
+
+def _iter_csv(path: str, columns: List[str], chunk_rows: int):
+    import pandas as pd
+
+    # usecols: el parser ni siquiera convierte las columnas no pedidas
+    reader = pd.read_csv(path, usecols=columns, chunksize=chunk_rows, engine="c",
+                         dtype={name: "float64" for name in columns})
+    with reader:
+        for frame in reader:
+            yield {name: frame[name].to_numpy() for name in columns}
+
+
+def _iter_parquet(path: str, columns: List[str], chunk_rows: int):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Para leer Parquet instala pyarrow: pip install pyarrow")
+
+    parquet_file = pq.ParquetFile(path)
+    for batch in parquet_file.iter_batches(batch_size=chunk_rows, columns=columns):
+        yield {name: batch.column(name).to_numpy(zero_copy_only=False) for name in columns}
+
+
+def numeric_columns(path: str, sample_rows: int = 1000) -> List[str]:
+    """Columnas numéricas: del esquema en Parquet, deducidas de las primeras filas en CSV"""
+    if Path(path).suffix.lower() in (".parquet", ".pq"):
+        try:
+            import pyarrow.parquet as pq
+            from pyarrow import types
+        except ImportError:
+            raise ImportError("Para leer Parquet instala pyarrow: pip install pyarrow")
+
+        # Sólo se lee el pie del archivo, no los datos
+        schema = pq.ParquetFile(path).schema_arrow
+        return [field.name for field in schema
+                if types.is_integer(field.type) or types.is_floating(field.type)]
+
+    import pandas as pd
+
+    return list(pd.read_csv(path, nrows=sample_rows).select_dtypes("number").columns)
+
+
+def load_columns(path: str, columns: List[str], chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                 dtype=np.float64) -> Dict[str, np.ndarray]:
+    """Carga las columnas completas (sólo para archivos que caben en memoria)"""
+    parts = {name: [] for name in columns}
+    for chunk in iter_columns(path, columns, chunk_rows, dtype):
+        for name in columns:
+            parts[name].append(chunk[name])
+    return {name: np.concatenate(values) if values else np.empty(0, dtype=dtype)
+            for name, values in parts.items()}
+
+
+def reservoir_sample(chunks: Iterable[Dict[str, np.ndarray]], size: int,
+                     seed: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """Muestra aleatoria uniforme de hasta size filas de un flujo de bloques
+
+    Memoria O(size) sin importar el largo del archivo. Por bloque se sortean
+    claves aleatorias y se conservan las size filas con las claves menores.
+    """
+    rng = np.random.default_rng(seed)
+    sample = None
+    keys = np.empty(0)
+
+    for chunk in chunks:
+        chunk_keys = rng.random(len(next(iter(chunk.values()))))
+        if sample is None:
+            sample = {name: values[:0] for name, values in chunk.items()}
+
+        keys = np.concatenate((keys, chunk_keys))
+        merged = {name: np.concatenate((sample[name], chunk[name])) for name in chunk}
+        if len(keys) > size:
+            keep = np.argpartition(keys, size)[:size]
+            keys = keys[keep]
+            merged = {name: values[keep] for name, values in merged.items()}
+        sample = merged
+
+    return sample or {}
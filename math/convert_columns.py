@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+import time
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+
+from converter import DEFAULT_CACHE_FILE, UNITS, CurrencyConverter
+
+DEFAULT_CHUNK_ROWS = 10_000
+
+
+def parse_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def parse_decimal(value):
+    try:
+        result = Decimal(str(value).strip())
+        return result if result.is_finite() else None
+    except InvalidOperation:
+        return None
+
+
+def format_value(value) -> str:
+    """Celdas inválidas o sin conversión quedan vacías"""
+    if value is None:
+        return ""
+    if isinstance(value, Decimal):
+        return str(value)
+    value = float(value)
+    return "" if math.isnan(value) else repr(value)
+
+
+def json_value(value):
+    """Inválidos → null; Decimal como texto para no perder exactitud"""
+    if value is None:
+        return None
+    if isinstance(value, Decimal):
+        return str(value)
+    value = float(value)
+    return None if math.isnan(value) else value
+
+
+def build_column_converter(spec: str, currencies: CurrencyConverter):
+    """Convierte 'columna:origen:destino' en (columna, función valores → convertidos)
+
+    Si origen y destino son unidades del registro se usa UNITS; si no, se tratan
+    como códigos de moneda, que deben tener tasa de cambio.
+    """
+    try:
+        column, from_unit, to_unit = spec.rsplit(":", 2)
+    except ValueError:
+        raise ValueError(f"Especificación inválida '{spec}', se espera columna:origen:destino")
+
+    try:
+        UNITS.plan(from_unit, to_unit)
+    except ValueError as e:
+        unit_error = e
+    else:
+        def convert(values):
+            return UNITS.convert_many([parse_float(value) for value in values], from_unit, to_unit)
+        return column, convert
+
+    from_code, to_code = from_unit.upper(), to_unit.upper()
+    if not currencies.rates:
+        currencies.get_exchange_rates()
+    unknown = [code for code in (from_code, to_code) if code not in currencies.currency_index]
+    if unknown:
+        raise ValueError(f"No se puede convertir '{spec}': {unit_error} "
+                         f"y no hay tasa de cambio para {', '.join(unknown)}")
+
+    if currencies.exact:
+        def convert(values):
+            amounts = [parse_decimal(value) for value in values]
+            return currencies.convert_many(amounts, from_code, to_code)
+    else:
+        def convert(values):
+            floats = [parse_float(value) for value in values]
+            return currencies.convert_many(floats, from_code, to_code)
+    return column, convert
+
+
+def iter_chunks(iterable, size: int):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def process_csv(source, target, converters, chunk_rows: int, suffix: str, stats: dict):
+    reader = csv.reader(source)
+    writer = csv.writer(target)
+
+    header = next(reader, None)
+    if header is None:
+        return
+
+    positions = []
+    output_header = list(header)
+    for column, convert in converters:
+        if column not in header:
+            raise ValueError(f"La columna '{column}' no existe en el CSV")
+        if suffix:
+            output_header.append(f"{column}{suffix}")
+            positions.append((header.index(column), len(output_header) - 1, convert))
+        else:
+            positions.append((header.index(column), header.index(column), convert))
+    writer.writerow(output_header)
+
+    # Las columnas nuevas se indexan desde el final: no dependen del largo de cada fila
+    extra = len(output_header) - len(header)
+    positions = [(source_index, target_index - len(output_header) if target_index >= len(header)
+                  else target_index, convert)
+                 for source_index, target_index, convert in positions]
+
+    # csv.reader devuelve [] para las líneas en blanco; las filas cortas se completan
+    rows_in = (row for row in reader if row)
+    for rows in iter_chunks(rows_in, chunk_rows):
+        rows = [row + [""] * (len(header) - len(row) + extra) if len(row) < len(header)
+                else row + [""] * extra for row in rows]
+        for source_index, target_index, convert in positions:
+            values = [row[source_index] for row in rows]
+            for row, value in zip(rows, convert(values)):
+                row[target_index] = format_value(value)
+        writer.writerows(rows)
+        target.flush()
+        report_progress(stats, len(rows))
+
+
+def process_ndjson(source, target, converters, chunk_rows: int, suffix: str, stats: dict):
+    lines = (line for line in source if line.strip())
+    for chunk in iter_chunks(lines, chunk_rows):
+        records = [json.loads(line) for line in chunk]
+        for column, convert in converters:
+            # Los registros sin la columna se dejan tal cual
+            present = [record for record in records if column in record]
+            values = [record[column] for record in present]
+            for record, value in zip(present, convert(values)):
+                record[f"{column}{suffix}"] = json_value(value)
+        target.write("".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records))
+        target.flush()
+        report_progress(stats, len(records))
+
+
+def report_progress(stats: dict, rows: int):
+    stats["filas"] += rows
+    stats["bloques"] += 1
+    if stats["progreso"] and stats["bloques"] % stats["progreso"] == 0:
+        elapsed = time.perf_counter() - stats["inicio"]
+        print(f"  {stats['filas']} filas, {stats['filas'] / elapsed:,.0f} filas/s", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convierte columnas de un CSV/NDJSON entre unidades o monedas, por bloques")
+    parser.add_argument("input", help="Archivo de entrada ('-' para stdin)")
+    parser.add_argument("-o", "--output", default="-", help="Archivo de salida ('-' para stdout)")
+    parser.add_argument("-c", "--column", action="append", required=True, dest="columns",
+                        help="columna:origen:destino, p. ej. temp:c:f, dist:mi:km, precio:USD:EUR")
+    parser.add_argument("--format", choices=["csv", "ndjson"],
+                        help="Formato (por defecto según la extensión)")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS,
+                        help="Filas por bloque")
+    parser.add_argument("--suffix", default="",
+                        help="Escribir el resultado en una columna nueva con este sufijo")
+    parser.add_argument("--exact", action="store_true",
+                        help="Monedas en modo Decimal exacto (en NDJSON se escriben como texto)")
+    parser.add_argument("--offline", action="store_true", help="Usar sólo tasas en caché")
+    parser.add_argument("--rates-cache", default=DEFAULT_CACHE_FILE,
+                        help="Archivo de caché de tasas")
+    parser.add_argument("--rates-url", default="https://api.exchangerate-api.com/v4/latest/",
+                        help="API de tasas (p. ej. la de rates_stub_server.py)")
+    parser.add_argument("--progress", type=int, default=0,
+                        help="Informar cada N bloques (0 = sólo al final)")
+    args = parser.parse_args()
+
+    file_format = args.format or ("ndjson" if args.input.endswith((".ndjson", ".jsonl")) else "csv")
+    currencies = CurrencyConverter(cache_file=args.rates_cache, offline=args.offline,
+                                   base_url=args.rates_url, exact=args.exact)
+    try:
+        converters = [build_column_converter(spec, currencies) for spec in args.columns]
+    except ValueError as e:
+        currencies.close()
+        parser.error(str(e))
+
+    columns = [column for column, _ in converters]
+    repeated = sorted({column for column in columns if columns.count(column) > 1})
+    if repeated:
+        currencies.close()
+        parser.error(f"Columnas repetidas: {', '.join(repeated)}")
+
+    source = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8", newline="")
+    target = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8", newline="")
+    stats = {"filas": 0, "bloques": 0, "progreso": args.progress, "inicio": time.perf_counter()}
+
+    try:
+        if file_format == "csv":
+            process_csv(source, target, converters, args.chunk_rows, args.suffix, stats)
+        else:
+            process_ndjson(source, target, converters, args.chunk_rows, args.suffix, stats)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+        currencies.close()
+
+    elapsed = time.perf_counter() - stats["inicio"] or 1e-9
+    report = f"✓ {stats['filas']} filas en {elapsed:.2f} s ({stats['filas'] / elapsed:,.0f} filas/s"
+    if args.input != "-":
+        report += f", {os.path.getsize(args.input) / 1_000_000 / elapsed:.2f} MB/s"
+    print(report + ")", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
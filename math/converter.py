@@ -1,9 +1,145 @@
+import asyncio
 import requests
 import json
-from typing import Dict, Optional
+import os
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Context, Decimal, ROUND_HALF_EVEN, localcontext
+from fractions import Fraction
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _apply_affine(values: Sequence[float], scale: float, offset: float):
+    """Aplica value * scale + offset a toda la secuencia
+
+    Un ndarray devuelve ndarray, cualquier array.array devuelve array('d') y el
+    resto de secuencias, una lista.
+    """
+    if np is not None:
+        if isinstance(values, np.ndarray):
+            result = np.multiply(values, scale, dtype=np.float64)
+            if offset:
+                result += offset
+            return result
+
+        if isinstance(values, array):
+            if values.typecode == 'd':
+                # Vista sin copia sobre el buffer del array
+                result = np.frombuffer(values, dtype=np.float64) * scale
+            else:
+                result = np.asarray(values, dtype=np.float64) * scale
+            if offset:
+                result += offset
+            return array('d', result.tobytes())
+
+        result = np.asarray(values, dtype=np.float64) * scale
+        if offset:
+            result += offset
+        return result.tolist()
+
+    if isinstance(values, array):
+        return array('d', [value * scale + offset for value in values])
+    return [value * scale + offset for value in values]
+
+
+# Dimensiones como exponentes de (longitud, masa, tiempo, temperatura)
+LENGTH = (1, 0, 0, 0)
+MASS = (0, 1, 0, 0)
+TIME = (0, 0, 1, 0)
+TEMPERATURE = (0, 0, 0, 1)
+
+SUPERSCRIPTS = str.maketrans("⁰¹²³⁴⁵⁶⁷⁸⁹⁻", "0123456789-")
+
+
+class UnitRegistry:
+    """Registro único de unidades con dimensión y transformación afín a la unidad base
+
+    Al registrar una unidad se precalcula el plan (escala, desplazamiento) hacia y desde
+    cada unidad de la misma dimensión, así cada conversión es una búsqueda O(1).
+    """
+
+    def __init__(self):
+        self.units = {}
+        self.plans = {}
+
+    def define(self, name: str, scale, dimension: Tuple[int, ...], offset=0):
+        """Registra una unidad: base = valor * scale + offset"""
+        scale = Fraction(str(scale)) if isinstance(scale, float) else Fraction(scale)
+        offset = Fraction(str(offset)) if isinstance(offset, float) else Fraction(offset)
+        self.units[name] = (scale, offset, tuple(dimension))
+
+        for other, (other_scale, other_offset, other_dimension) in self.units.items():
+            if other_dimension != tuple(dimension):
+                continue
+            self.plans[(name, other)] = (float(scale / other_scale),
+                                         float((offset - other_offset) / other_scale))
+            self.plans[(other, name)] = (float(other_scale / scale),
+                                         float((other_offset - offset) / scale))
+
+    def unit(self, expression: str) -> str:
+        """Devuelve la unidad, registrando al vuelo compuestas como 'km/h' o 'kg/m²'"""
+        if expression in self.units:
+            return expression
+
+        scale = Fraction(1)
+        dimension = [0, 0, 0, 0]
+        sign = 1
+        term = ""
+
+        # Cada '*' o '/' afecta sólo al término siguiente, de izquierda a derecha
+        for char in expression.translate(SUPERSCRIPTS).replace("^", "") + "*":
+            if char in "*·/":
+                if not term:
+                    raise ValueError(f"Unidad no válida: {expression}")
+                name = term.rstrip("0123456789-")
+                power = int(term[len(name):] or 1) * sign
+                if name not in self.units:
+                    raise ValueError(f"Unidad no válida: {name}")
+                unit_scale, unit_offset, unit_dimension = self.units[name]
+                if unit_offset:
+                    raise ValueError(f"La unidad '{name}' tiene desplazamiento y no puede combinarse")
+                scale *= unit_scale ** power
+                dimension = [d + u * power for d, u in zip(dimension, unit_dimension)]
+                sign = -1 if char == "/" else 1
+                term = ""
+            elif not char.isspace():
+                term += char
+
+        self.define(expression, scale, tuple(dimension))
+        return expression
+
+    def plan(self, from_unit: str, to_unit: str) -> Tuple[float, float]:
+        """(escala, desplazamiento) tal que destino = origen * escala + desplazamiento"""
+        key = (self.unit(from_unit), self.unit(to_unit))
+        if key not in self.plans:
+            raise ValueError(f"Unidades incompatibles: {from_unit} → {to_unit}")
+        return self.plans[key]
+
+    def convert(self, value: float, from_unit: str, to_unit: str) -> float:
+        scale, offset = self.plan(from_unit, to_unit)
+        return value * scale + offset
+
+    def convert_many(self, values: Sequence[float], from_unit: str, to_unit: str):
+        scale, offset = self.plan(from_unit, to_unit)
+        return _apply_affine(values, scale, offset)
 
 
 class TemperatureConverter:
+    # Unidad → (escala, desplazamiento) para pasar a Kelvin: K = x * escala + desplazamiento
+    # En fracciones exactas para que la combinación no acumule error de redondeo
+    AFFINE_TO_KELVIN = {
+        'c': (Fraction(1), Fraction('273.15')),
+        'f': (Fraction(5, 9), Fraction('273.15') - Fraction(160, 9)),
+        'k': (Fraction(1), Fraction(0))
+    }
 
     @staticmethod
     def celsius_to_fahrenheit(celsius: float) -> float:
@@ -29,6 +165,18 @@ class TemperatureConverter:
     def kelvin_to_fahrenheit(kelvin: float) -> float:
         return TemperatureConverter.celsius_to_fahrenheit(kelvin - 273.15)
 
+    @classmethod
+    def get_affine(cls, from_unit: str, to_unit: str) -> Tuple[float, float]:
+        if from_unit not in cls.AFFINE_TO_KELVIN or to_unit not in cls.AFFINE_TO_KELVIN:
+            raise ValueError("Unidad no válida")
+
+        return UNITS.plan(from_unit, to_unit)
+
+    @classmethod
+    def convert_many(cls, values: Sequence[float], from_unit: str, to_unit: str):
+        scale, offset = cls.get_affine(from_unit, to_unit)
+        return _apply_affine(values, scale, offset)
+
 
 class DistanceConverter:
     CONVERSION_FACTORS = {
@@ -51,6 +199,18 @@ class DistanceConverter:
         result = meters / cls.CONVERSION_FACTORS[to_unit]
         return result
 
+    @classmethod
+    def get_affine(cls, from_unit: str, to_unit: str) -> Tuple[float, float]:
+        if from_unit not in cls.CONVERSION_FACTORS or to_unit not in cls.CONVERSION_FACTORS:
+            raise ValueError("Unidad no válida")
+
+        return UNITS.plan(from_unit, to_unit)
+
+    @classmethod
+    def convert_many(cls, values: Sequence[float], from_unit: str, to_unit: str):
+        scale, offset = cls.get_affine(from_unit, to_unit)
+        return _apply_affine(values, scale, offset)
+
 
 class WeightConverter:
     CONVERSION_FACTORS = {
@@ -71,49 +231,413 @@ class WeightConverter:
         result = grams / cls.CONVERSION_FACTORS[to_unit]
         return result
 
+    @classmethod
+    def get_affine(cls, from_unit: str, to_unit: str) -> Tuple[float, float]:
+        if from_unit not in cls.CONVERSION_FACTORS or to_unit not in cls.CONVERSION_FACTORS:
+            raise ValueError("Unidad no válida")
 
-class CurrencyConverter:
+        return UNITS.plan(from_unit, to_unit)
 
-    def __init__(self):
-        self.base_url = "https://api.exchangerate-api.com/v4/latest/"
+    @classmethod
+    def convert_many(cls, values: Sequence[float], from_unit: str, to_unit: str):
+        scale, offset = cls.get_affine(from_unit, to_unit)
+        return _apply_affine(values, scale, offset)
+
+
+UNITS = UnitRegistry()
+
+for _unit, (_scale, _offset) in TemperatureConverter.AFFINE_TO_KELVIN.items():
+    UNITS.define(_unit, _scale, TEMPERATURE, _offset)
+for _unit, _factor in DistanceConverter.CONVERSION_FACTORS.items():
+    UNITS.define(_unit, _factor, LENGTH)
+for _unit, _factor in WeightConverter.CONVERSION_FACTORS.items():
+    UNITS.define(_unit, _factor, MASS)
+for _unit, _factor in {'s': 1, 'min': 60, 'h': 3600, 'día': 86400}.items():
+    UNITS.define(_unit, _factor, TIME)
+for _unit in ('m/s', 'km/h', 'mi/h', 'ft/s', 'm/s²', 'kg/m²', 'g/cm³', 'kg/m³', 'lb/in²'):
+    UNITS.unit(_unit)
+
+
+@lru_cache(maxsize=256)
+def get_converter(from_unit: str, to_unit: str) -> Callable[[float], float]:
+    """Devuelve una función precompilada (una multiplicación y una suma) para el par de unidades"""
+    scale, offset = UNITS.plan(from_unit, to_unit)
+
+    if offset:
+        return lambda value: value * scale + offset
+    return lambda value: value * scale
+
+
+# Caché de tasas en el directorio de caché del usuario, no en el directorio de trabajo
+DEFAULT_CACHE_FILE = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+                                  "conversor", "exchange_rates_cache.json")
+
+
+class CurrencyConverter:
+    # Decimales de la unidad menor (ISO 4217) que difieren de 2
+    MINOR_UNITS = {
+        'BIF': 0, 'CLP': 0, 'DJF': 0, 'GNF': 0, 'ISK': 0, 'JPY': 0, 'KMF': 0,
+        'KRW': 0, 'PYG': 0, 'RWF': 0, 'UGX': 0, 'UYI': 0, 'VND': 0, 'VUV': 0,
+        'XAF': 0, 'XOF': 0, 'XPF': 0,
+        'BHD': 3, 'IQD': 3, 'JOD': 3, 'KWD': 3, 'LYD': 3, 'OMR': 3, 'TND': 3,
+        'CLF': 4, 'UYW': 4
+    }
+    DEFAULT_MINOR_UNIT = 2
+
+    def __init__(self, cache_file: Optional[str] = DEFAULT_CACHE_FILE,
+                 ttl: float = 3600, max_stale: float = 7 * 86400, offline: bool = False,
+                 base_url: str = "https://api.exchangerate-api.com/v4/latest/",
+                 max_connections: int = 10, exact: bool = False,
+                 rounding: str = ROUND_HALF_EVEN):
+        """
+        cache_file: JSON con las tasas por moneda base (None desactiva el disco)
+        ttl: segundos durante los que una entrada se considera fresca
+        max_stale: segundos durante los que una entrada vencida se sigue sirviendo
+                   mientras se actualiza en segundo plano
+        offline: no hacer peticiones HTTP, usar sólo la caché
+        base_url: API de tasas (p. ej. el servidor local de rates_stub_server.py)
+        max_connections: tamaño del pool de conexiones y peticiones simultáneas
+        exact: convert y convert_many devuelven Decimal redondeado a la unidad menor
+        rounding: modo de redondeo de decimal (ROUND_HALF_EVEN, ROUND_HALF_UP, ...)
+        """
+        self.base_url = base_url
         self.rates = {}
         self.last_update = None
+        self.base_currency = None
+        # (índice de códigos, tabla cruzada) en una sola tupla: el hilo de actualización
+        # en segundo plano los reemplaza juntos con una única asignación
+        self._table = self._build_cross_rates({})
+        self.exact = exact
+        # Contexto compartido: evita buscar el contexto del hilo en cada operación
+        self.decimal_context = Context(prec=28, rounding=rounding)
+        self._decimal_rates = {}
+        self._quantizers = {}
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.offline = offline
+        self.cache = self._load_cache()
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self.max_connections = max_connections
+        self._in_flight = {}
+        # Un hilo por conexión del pool para las descargas asíncronas; se crea al primer uso
+        self._executor = None
+
+        # Sesión compartida: reutiliza conexiones keep-alive entre peticiones e hilos
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=max_connections,
+                                                pool_maxsize=max_connections)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self):
+        """Libera los hilos de descarga y las conexiones de la sesión"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _load_cache(self) -> Dict:
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Aviso: caché de tasas ilegible, se ignora ({e})")
+            return {}
+
+        if not isinstance(cache, dict):
+            print("Aviso: caché de tasas ilegible, se ignora (no es un objeto JSON)")
+            return {}
+        entries = {base: entry for base, entry in cache.items() if self._valid_entry(entry)}
+        if len(entries) < len(cache):
+            print(f"Aviso: caché de tasas ilegible, se ignoran {len(cache) - len(entries)} entradas")
+        return entries
+
+    @staticmethod
+    def _valid_entry(entry) -> bool:
+        """Una entrada usable: tasas numéricas y hora de descarga"""
+        return (isinstance(entry, dict) and isinstance(entry.get('rates'), dict)
+                and isinstance(entry.get('fetched_at'), (int, float))
+                and all(isinstance(rate, (int, float)) for rate in entry['rates'].values()))
+
+    def _save_cache(self):
+        if not self.cache_file:
+            return
+        # Escritura atómica: un proceso concurrente nunca lee un JSON a medias
+        temp_file = f"{self.cache_file}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_file) or ".", exist_ok=True)
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(self.cache, f, indent=2)
+            os.replace(temp_file, self.cache_file)
+        except OSError as e:
+            print(f"Aviso: no se pudo guardar la caché de tasas ({e})")
+
+    def _fetch(self, base_currency: str) -> Dict:
+        response = self.session.get(f"{self.base_url}{base_currency}", timeout=10)
+        response.raise_for_status()
+        data = response.json()
+        entry = {
+            'rates': data.get('rates', {}),
+            'date': data.get('date', 'Desconocido'),
+            'fetched_at': time.time()
+        }
+        with self._lock:
+            self.cache[base_currency] = entry
+            self._save_cache()
+        return entry
+
+    def _use(self, base_currency: str, entry: Dict) -> Dict:
+        rates = dict(entry['rates'])
+        rates.setdefault(base_currency, 1.0)
+        index, cross_rates = self._build_cross_rates(rates)
+
+        self._table = (index, cross_rates)
+        self._decimal_rates = {}
+        self.rates = entry['rates']
+        self.last_update = entry.get('date', 'Desconocido')
+        self.base_currency = base_currency
+        return self.rates
+
+    @property
+    def currency_index(self) -> Dict[str, int]:
+        return self._table[0]
+
+    @property
+    def cross_rates(self):
+        return self._table[1]
+
+    @staticmethod
+    def _build_cross_rates(rates: Dict[str, float]):
+        """Tabla N×N con cross[i][j] = unidades de j por unidad de i"""
+        codes = [code for code, rate in rates.items() if rate]
+        index = {code: i for i, code in enumerate(codes)}
+        values = [float(rates[code]) for code in codes]
+
+        if np is not None:
+            # Fila y columna extra en NaN: centinela para códigos desconocidos en convert_many
+            size = len(values)
+            column = np.array(values)
+            cross_rates = np.full((size + 1, size + 1), np.nan)
+            cross_rates[:size, :size] = column[np.newaxis, :] / column[:, np.newaxis]
+            return index, cross_rates
+        return index, [[to_rate / from_rate for to_rate in values] for from_rate in values]
+
+    def _refresh_in_background(self, base_currency: str):
+        with self._lock:
+            if base_currency in self._refreshing:
+                return
+            self._refreshing.add(base_currency)
+
+        def refresh():
+            try:
+                entry = self._fetch(base_currency)
+                if self.base_currency == base_currency:
+                    self._use(base_currency, entry)
+            except requests.RequestException:
+                pass
+            finally:
+                with self._lock:
+                    self._refreshing.discard(base_currency)
+
+        threading.Thread(target=refresh, daemon=True).start()
 
     def get_exchange_rates(self, base_currency: str = "USD") -> Dict:
+        entry = self.cache.get(base_currency)
+        age = time.time() - entry['fetched_at'] if entry else None
+
+        if entry and age < self.ttl:
+            return self._use(base_currency, entry)
+
+        if entry and self.offline:
+            return self._use(base_currency, entry)
+
+        if entry and age < self.ttl + self.max_stale:
+            # Stale-while-revalidate: responder ya con la caché y actualizar aparte
+            self._refresh_in_background(base_currency)
+            return self._use(base_currency, entry)
+
+        if self.offline:
+            print(f"Sin tasas en caché para {base_currency} (modo sin conexión)")
+            return {}
+
         try:
-            response = requests.get(f"{self.base_url}{base_currency}", timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            self.rates = data.get('rates', {})
-            self.last_update = data.get('date', 'Desconocido')
-            return self.rates
+            return self._use(base_currency, self._fetch(base_currency))
         except requests.RequestException as e:
             print(f"Error al obtener tasas de cambio: {e}")
+            if entry:
+                print("Usando tasas en caché vencidas")
+                return self._use(base_currency, entry)
             return {}
 
+    async def fetch_rates_async(self, base_currency: str,
+                                semaphore: Optional[asyncio.Semaphore] = None) -> Dict:
+        """Descarga las tasas de una base; llamadas concurrentes comparten la misma petición"""
+        task = self._in_flight.get(base_currency)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_in_thread(base_currency, semaphore))
+            self._in_flight[base_currency] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(base_currency, None))
+
+        # shield: si un llamador se cancela, la petición compartida sigue para los demás
+        return await asyncio.shield(task)
+
+    async def _fetch_in_thread(self, base_currency: str,
+                               semaphore: Optional[asyncio.Semaphore]) -> Dict:
+        # La petición bloqueante corre en un hilo usando el pool de la sesión
+        loop = asyncio.get_running_loop()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_connections)
+        if semaphore is None:
+            return await loop.run_in_executor(self._executor, self._fetch, base_currency)
+        async with semaphore:
+            return await loop.run_in_executor(self._executor, self._fetch, base_currency)
+
+    async def refresh_many(self, base_currencies: Sequence[str]) -> Dict[str, Optional[Dict]]:
+        """Actualiza varias monedas base a la vez, como mucho max_connections en paralelo"""
+        if self.offline:
+            return {base: self.cache.get(base) for base in base_currencies}
+
+        semaphore = asyncio.Semaphore(self.max_connections)
+        results = await asyncio.gather(*(self.fetch_rates_async(base, semaphore)
+                                         for base in base_currencies),
+                                       return_exceptions=True)
+
+        entries = {}
+        for base, result in zip(base_currencies, results):
+            if isinstance(result, requests.RequestException):
+                print(f"Error al obtener tasas de {base}: {result}")
+                entries[base] = self.cache.get(base)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                entries[base] = result
+        return entries
+
+    def refresh_rates(self, base_currencies: Sequence[str]) -> Dict[str, Optional[Dict]]:
+        """Versión síncrona de refresh_many"""
+        return asyncio.run(self.refresh_many(base_currencies))
+
     def convert(self, amount: float, from_currency: str, to_currency: str) -> Optional[float]:
+        if self.exact:
+            return self.convert_exact(amount, from_currency, to_currency)
+
         if not self.rates:
             self.get_exchange_rates()
 
-        if not self.rates:
+        index, cross_rates = self._table
+        i = index.get(from_currency)
+        j = index.get(to_currency)
+        if i is None or j is None:
             return None
 
-        try:
-            if from_currency == "USD":
-                rate = self.rates.get(to_currency)
-                if rate:
-                    return amount * rate
-            elif to_currency == "USD":
-                rate = self.rates.get(from_currency)
-                if rate:
-                    return amount / rate
-            else:
-                usd_amount = amount / self.rates.get(from_currency, 1)
-                return usd_amount * self.rates.get(to_currency, 1)
-        except (KeyError, ZeroDivisionError):
+        return amount * float(cross_rates[i][j])
+
+    def convert_many(self, amounts: Sequence[float], from_codes, to_codes):
+        """Convierte en bloque; from_codes/to_codes son un código o una secuencia por fila
+
+        Las filas con monedas desconocidas dan NaN (NumPy) o None (listas).
+        """
+        if self.exact:
+            return self.convert_many_exact(amounts, from_codes, to_codes)
+
+        if not self.rates:
+            self.get_exchange_rates()
+
+        index, cross_rates = self._table
+        if np is not None:
+            amounts = np.asarray(amounts, dtype=np.float64)
+            rows = len(amounts)
+            return amounts * cross_rates[self._indices(index, from_codes, rows),
+                                         self._indices(index, to_codes, rows)]
+
+        rows = len(amounts)
+        from_codes = [from_codes] * rows if isinstance(from_codes, str) else from_codes
+        to_codes = [to_codes] * rows if isinstance(to_codes, str) else to_codes
+        result = []
+        for amount, from_code, to_code in zip(amounts, from_codes, to_codes):
+            i = index.get(from_code)
+            j = index.get(to_code)
+            result.append(None if i is None or j is None else amount * cross_rates[i][j])
+        return result
+
+    def _quantizer(self, currency: str) -> Decimal:
+        quantizer = self._quantizers.get(currency)
+        if quantizer is None:
+            places = self.MINOR_UNITS.get(currency, self.DEFAULT_MINOR_UNIT)
+            quantizer = Decimal(1).scaleb(-places)
+            self._quantizers[currency] = quantizer
+        return quantizer
+
+    def _decimal_rate(self, from_currency: str, to_currency: str) -> Optional[Decimal]:
+        """Tasa cruzada exacta en Decimal, calculada una vez por par"""
+        key = (from_currency, to_currency)
+        rate = self._decimal_rates.get(key)
+        if rate is None and key not in self._decimal_rates:
+            rates = self.rates
+            from_rate = 1 if from_currency == self.base_currency else rates.get(from_currency)
+            to_rate = 1 if to_currency == self.base_currency else rates.get(to_currency)
+            if from_rate and to_rate:
+                # repr del float = el decimal que envió la API
+                rate = self.decimal_context.divide(Decimal(repr(to_rate)), Decimal(repr(from_rate)))
+            self._decimal_rates[key] = rate
+        return rate
+
+    def convert_exact(self, amount, from_currency: str, to_currency: str) -> Optional[Decimal]:
+        """Convierte con Decimal y redondea a la unidad menor de la moneda destino"""
+        if not self.rates:
+            self.get_exchange_rates()
+
+        rate = self._decimal_rate(from_currency, to_currency)
+        if rate is None:
             return None
 
-        return None
+        context = self.decimal_context
+        amount = amount if isinstance(amount, Decimal) else Decimal(str(amount))
+        return context.multiply(amount, rate).quantize(self._quantizer(to_currency), context=context)
+
+    def convert_many_exact(self, amounts: Sequence, from_codes, to_codes) -> list:
+        """Versión Decimal de convert_many; filas sin importe o con monedas desconocidas dan None"""
+        if not self.rates:
+            self.get_exchange_rates()
+
+        rows = len(amounts)
+        from_codes = [from_codes] * rows if isinstance(from_codes, str) else from_codes
+        to_codes = [to_codes] * rows if isinstance(to_codes, str) else to_codes
+
+        # (tasa, cuantizador) de cada par distinto, resuelto antes de recorrer las filas
+        plans = {}
+        for from_code, to_code in set(zip(from_codes, to_codes)):
+            rate = self._decimal_rate(from_code, to_code)
+            plans[from_code, to_code] = None if rate is None else (rate, self._quantizer(to_code))
+
+        # Contexto local: * y quantize usan la precisión y el redondeo configurados
+        with localcontext(self.decimal_context):
+            return [None if amount is None or plan is None
+                    else ((amount if isinstance(amount, Decimal) else Decimal(str(amount)))
+                          * plan[0]).quantize(plan[1])
+                    for amount, plan in zip(amounts, map(plans.__getitem__, zip(from_codes, to_codes)))]
+
+    @staticmethod
+    def _indices(index: Dict[str, int], codes, rows: int):
+        """Traduce códigos a índices de la tabla (el centinela para desconocidos)"""
+        unknown = len(index)
+        if isinstance(codes, str):
+            return np.full(rows, index.get(codes, unknown), dtype=np.intp)
+
+        if isinstance(codes, np.ndarray):
+            codes = codes.tolist()
+        # Una búsqueda en el dict por fila; np.unique ordenaría todas las cadenas
+        return np.fromiter((index.get(code, unknown) for code in codes), dtype=np.intp, count=rows)
 
 
 def show_menu():
@@ -124,7 +648,8 @@ def show_menu():
     print("2. Distancia")
     print("3. Peso")
     print("4. Moneda")
-    print("5. Salir")
+    print("5. Otras unidades (km/h, kg/m², ...)")
+    print("6. Salir")
     print("-" * 50)
 
 
@@ -199,25 +724,42 @@ def weight_menu():
         print(f"Error: Ingresa valores válidos")
 
 
+def units_menu():
+    print("\n--- CONVERSOR GENERAL DE UNIDADES ---")
+    print("Unidades registradas:", ", ".join(UNITS.units))
+    print("También se aceptan combinaciones como ft/min, g/cm² o kg*m/s²")
+
+    try:
+        value = float(input("Ingresa el valor: "))
+        from_unit = input("Unidad origen: ").strip()
+        to_unit = input("Unidad destino: ").strip()
+
+        result = UNITS.convert(value, from_unit, to_unit)
+        print(f"Resultado: {value} {from_unit} = {result:.6f} {to_unit}")
+
+    except ValueError as e:
+        print(f"Error: {e}")
+
+
 def currency_menu():
     print("\n--- CONVERSOR DE MONEDA ---")
     print("Monedas comunes: USD, EUR, GBP, JPY, CAD, AUD, CHF, CNY, MXN, COP")
 
     try:
-        converter = CurrencyConverter()
-        print("Obteniendo tasas de cambio...")
+        with CurrencyConverter() as converter:
+            print("Obteniendo tasas de cambio...")
 
-        amount = float(input("Ingresa la cantidad: "))
-        from_currency = input("Moneda origen (ej. USD): ").upper()
-        to_currency = input("Moneda destino (ej. EUR): ").upper()
+            amount = float(input("Ingresa la cantidad: "))
+            from_currency = input("Moneda origen (ej. USD): ").upper()
+            to_currency = input("Moneda destino (ej. EUR): ").upper()
 
-        result = converter.convert(amount, from_currency, to_currency)
+            result = converter.convert(amount, from_currency, to_currency)
 
-        if result is not None:
-            print(f"Resultado: {amount} {from_currency} = {result:.4f} {to_currency}")
-            print(f"Última actualización: {converter.last_update}")
-        else:
-            print("Error: No se pudo realizar la conversión")
+            if result is not None:
+                print(f"Resultado: {amount} {from_currency} = {result:.4f} {to_currency}")
+                print(f"Última actualización: {converter.last_update}")
+            else:
+                print("Error: No se pudo realizar la conversión")
 
     except ValueError:
         print("Error: Ingresa valores válidos")
@@ -241,6 +783,8 @@ def main():
         elif choice == '4':
             currency_menu()
         elif choice == '5':
+            units_menu()
+        elif choice == '6':
             print("¡Gracias por usar el conversor!")
             break
         else:
@@ -0,0 +1,57 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+# Elementos de la matriz de índices por lote (≈16 MB de int64)
+DEFAULT_BATCH_ELEMENTS = 2_000_000
+
+_worker_data = None
+
+
+def _init_worker(data):
+    global _worker_data
+    _worker_data = data
+
+
+def _run_task(task: Callable, sizes: Sequence[int], seed, args: tuple):
+    return task(_worker_data, sizes, np.random.default_rng(seed), *args)
+
+
+def plan_tasks(total: int, batch_size: int, tasks: int):
+    """Reparte total filas en tareas de lotes; fijo para una misma semilla"""
+    batches = [batch_size] * (total // batch_size)
+    if total % batch_size:
+        batches.append(total % batch_size)
+    return [batches[i::tasks] for i in range(tasks) if batches[i::tasks]]
+
+
+def run_batches(task: Callable, data, total: int, row_length: int, args: tuple = (),
+                workers: Optional[int] = 1, seed: Optional[int] = None,
+                batch_elements: int = DEFAULT_BATCH_ELEMENTS, tasks: int = 16) -> list:
+    """Ejecuta task(data, tamaños, rng, *args) sobre total filas y devuelve lo de cada tarea
+
+    Cada lote tiene como mucho batch_elements // row_length filas. Cada tarea
+    recibe un hijo de SeedSequence(seed): el resultado no depende de cuántos
+    procesos se usen. Con varios procesos, data se envía una vez a cada uno y
+    task debe estar definida a nivel de módulo.
+    """
+    batch_size = max(1, batch_elements // max(row_length, 1))
+    plan = plan_tasks(total, batch_size, tasks)
+    seeds = np.random.SeedSequence(seed).spawn(len(plan))
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        _init_worker(data)
+        try:
+            return [_run_task(task, sizes, task_seed, args) for sizes, task_seed in zip(plan, seeds)]
+        finally:
+            # No retener los datos del llamador una vez terminadas las tareas
+            _init_worker(None)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(data,)) as executor:
+        futures = [executor.submit(_run_task, task, sizes, task_seed, args)
+                   for sizes, task_seed in zip(plan, seeds)]
+        return [future.result() for future in futures]
@@ -0,0 +1,36 @@
+import time
+import tracemalloc
+
+
+def time_call(func, argument, min_time: float, max_repeat: int) -> tuple:
+    """Mejor tiempo y número de repeticiones hasta acumular min_time"""
+    best = float("inf")
+    repeat = 0
+    total = 0.0
+    while repeat < max_repeat and (repeat == 0 or total < min_time):
+        start = time.perf_counter()
+        func(argument)
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        total += elapsed
+        repeat += 1
+    return best, repeat
+
+
+def peak_memory(func, argument) -> int:
+    """Pico de memoria asignada (bytes) durante una llamada"""
+    tracemalloc.start()
+    try:
+        func(argument)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def parse_size(value: str) -> int:
+    """Convierte '1K', '10M' o '1000' a un entero"""
+    value = value.strip().upper()
+    multipliers = {"K": 1_000, "M": 1_000_000, "G": 1_000_000_000}
+    if value[-1] in multipliers:
+        return int(float(value[:-1]) * multipliers[value[-1]])
+    return int(value)
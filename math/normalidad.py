@@ -0,0 +1,212 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Optional, Sequence
+
+import numpy as np
+from scipy.special import ndtr, ndtri
+
+# Polinomios de Royston (1992, 1995), los mismos que usa scipy.stats.shapiro (swilk)
+C1 = [0.0, 0.221157, -0.147981, -2.071190, 4.434685, -2.706056]
+C2 = [0.0, 0.042981, -0.293762, -1.752461, 5.682633, -3.582633]
+C3 = [0.5440, -0.39978, 0.025054, -6.714e-4]
+C4 = [1.3822, -0.77857, 0.062767, -0.0020322]
+C5 = [-1.5861, -0.31082, -0.083751, 0.0038915]
+C6 = [-0.4803, -0.082676, 0.0030302]
+G = [-2.273, 0.459]
+
+# Columnas por tarea al repartir entre procesos
+DEFAULT_BLOCK_COLUMNS = 256
+
+RESULT_DTYPE = [("columna", "U64"), ("n", "i8"), ("W", "f8"), ("p", "f8"), ("rechaza", "?")]
+
+
+def _poly(coefficients, x):
+    return np.polynomial.polynomial.polyval(x, coefficients)
+
+
+@lru_cache(maxsize=None)
+def shapiro_coefficients(n: int) -> np.ndarray:
+    """Coeficientes a₁..aₙ de Shapiro-Wilk (antisimétricos), calculados una vez por n"""
+    if n < 3:
+        raise ValueError("Shapiro-Wilk necesita al menos 3 valores")
+
+    half = n // 2
+    coefficients = np.zeros(n)
+    if n == 3:
+        lower = np.array([np.sqrt(0.5)])
+    else:
+        m = ndtri((np.arange(1, half + 1) - 0.375) / (n + 0.25))
+        summ2 = 2 * np.sum(m * m)
+        ssumm2 = np.sqrt(summ2)
+        rsn = 1 / np.sqrt(n)
+
+        a1 = _poly(C1, rsn) - m[0] / ssumm2
+        if n > 5:
+            a2 = -m[1] / ssumm2 + _poly(C2, rsn)
+            fac = np.sqrt((summ2 - 2 * m[0] ** 2 - 2 * m[1] ** 2) / (1 - 2 * a1 ** 2 - 2 * a2 ** 2))
+            lower = -m / fac
+            lower[1] = a2
+        else:
+            fac = np.sqrt((summ2 - 2 * m[0] ** 2) / (1 - 2 * a1 ** 2))
+            lower = -m / fac
+        lower[0] = a1
+
+    # a[i] multiplica al i-ésimo menor con signo negativo y al i-ésimo mayor con positivo
+    coefficients[:half] = -lower
+    coefficients[n - half:] = lower[::-1]
+    coefficients.setflags(write=False)
+    return coefficients
+
+
+def _p_values(w: np.ndarray, n: int) -> np.ndarray:
+    """Valor p de Royston para un vector de W con el mismo n"""
+    if n == 3:
+        return np.maximum(0.0, 6 / np.pi * (np.arcsin(np.sqrt(w)) - np.pi / 3))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        w1 = np.log1p(-w)
+        if n <= 11:
+            gamma = _poly(G, n)
+            tiny = w1 >= gamma
+            w1 = -np.log(gamma - w1)
+            mean = _poly(C3, n)
+            std = np.exp(_poly(C4, n))
+        else:
+            tiny = np.zeros(w.shape, dtype=bool)
+            log_n = np.log(n)
+            mean = _poly(C5, log_n)
+            std = np.exp(_poly(C6, log_n))
+
+    p = 1 - ndtr((w1 - mean) / std)
+    p[tiny] = 1e-99
+    return p
+
+
+def _shapiro_same_n(values: np.ndarray):
+    """W y p para columnas sin faltantes del mismo n: un sort y un producto matricial"""
+    n = values.shape[0]
+    ordered = np.sort(values, axis=0)
+    centered = ordered - ordered.mean(axis=0)
+    ssq = np.einsum("ij,ij->j", centered, centered)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        w = (shapiro_coefficients(n) @ ordered) ** 2 / ssq
+    w = np.minimum(w, 1.0)
+    p = _p_values(w, n)
+    # Columnas constantes: W no está definido
+    w[ssq == 0] = np.nan
+    p[ssq == 0] = np.nan
+    return w, p
+
+
+def shapiro_batch(data, alpha: float = 0.05, names: Optional[Sequence[str]] = None) -> np.ndarray:
+    """Shapiro-Wilk para cada columna de un array 2-D (filas, columnas)
+
+    Los NaN se ignoran por columna; las columnas se agrupan por n válido y cada
+    grupo se resuelve con operaciones vectorizadas. Devuelve un array estructurado
+    con columna, n, W, p y rechaza (p < alpha).
+    """
+    values = np.asarray(data, dtype=np.float64)
+    if values.ndim == 1:
+        values = values[:, np.newaxis]
+    columns = values.shape[1]
+    names = list(names) if names is not None else [str(i) for i in range(columns)]
+
+    counts = np.count_nonzero(~np.isnan(values), axis=0)
+    w = np.full(columns, np.nan)
+    p = np.full(columns, np.nan)
+
+    if (counts == values.shape[0]).all():
+        if values.shape[0] >= 3:
+            w, p = _shapiro_same_n(values)
+    else:
+        # np.sort deja los NaN al final: las primeras n filas son los valores válidos
+        ordered = np.sort(values, axis=0)
+        for n in np.unique(counts):
+            if n < 3:
+                continue
+            selected = counts == n
+            w[selected], p[selected] = _shapiro_same_n(ordered[:n, selected])
+
+    table = np.zeros(columns, dtype=RESULT_DTYPE)
+    table["columna"] = names
+    table["n"] = counts
+    table["W"] = w
+    table["p"] = p
+    table["rechaza"] = p < alpha
+    return table
+
+
+def shapiro_many(data, alpha: float = 0.05, names: Optional[Sequence[str]] = None,
+                 workers: Optional[int] = None,
+                 block_columns: int = DEFAULT_BLOCK_COLUMNS) -> np.ndarray:
+    """shapiro_batch repartido por bloques de columnas en un pool de procesos"""
+    values = np.asarray(data, dtype=np.float64)
+    if values.ndim == 1:
+        values = values[:, np.newaxis]
+    columns = values.shape[1]
+    names = list(names) if names is not None else [str(i) for i in range(columns)]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or columns <= block_columns:
+        return shapiro_batch(values, alpha, names)
+
+    starts = range(0, columns, block_columns)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(shapiro_batch, values[:, start:start + block_columns], alpha,
+                                   names[start:start + block_columns])
+                   for start in starts]
+        return np.concatenate([future.result() for future in futures])
+
+
+def shapiro_file(path: str, columns: List[str], alpha: float = 0.05, sample: int = 5000,
+                 seed: Optional[int] = None, workers: Optional[int] = None) -> np.ndarray:
+    """Shapiro-Wilk de muchas columnas de un CSV/Parquet grande
+
+    Se toma en una pasada una muestra aleatoria común de hasta sample filas
+    (el valor p de Royston es válido hasta n = 5000).
+    """
+    from cargador import iter_columns, reservoir_sample
+
+    chunks = iter_columns(path, columns, dropna=False)
+    drawn = reservoir_sample(chunks, sample, seed)
+    if not drawn:
+        return np.zeros(0, dtype=RESULT_DTYPE)
+    values = np.column_stack([drawn[name] for name in columns])
+    return shapiro_many(values, alpha, columns, workers)
+
+
+def print_table(table: np.ndarray):
+    print(f"{'Columna':<24} {'n':>6} {'W':>8} {'p':>10}  Normal")
+    print("-" * 60)
+    for row in table:
+        verdict = "—" if np.isnan(row["p"]) else ("❌ no" if row["rechaza"] else "✅ sí")
+        print(f"{row['columna'][:24]:<24} {row['n']:>6} {row['W']:>8.4f} {row['p']:>10.4g}  {verdict}")
+    tested = ~np.isnan(table["p"])
+    print(f"\nRechazan normalidad: {int(table['rechaza'].sum())} de {int(tested.sum())} columnas")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shapiro-Wilk para muchas columnas de un CSV/Parquet")
+    parser.add_argument("archivo", help="CSV o Parquet")
+    parser.add_argument("--columnas", nargs="+",
+                        help="Columnas a probar (por defecto todas las numéricas)")
+    parser.add_argument("--alfa", type=float, default=0.05, help="Nivel de significancia")
+    parser.add_argument("--muestra", type=int, default=5000, help="Filas muestreadas del archivo")
+    parser.add_argument("--semilla", type=int, default=None, help="Semilla de la muestra")
+    parser.add_argument("--procesos", type=int, default=None, help="Procesos del pool")
+    args = parser.parse_args()
+
+    columns = args.columnas
+    if not columns:
+        from cargador import numeric_columns
+
+        columns = numeric_columns(args.archivo)
+
+    table = shapiro_file(args.archivo, columns, args.alfa, args.muestra, args.semilla, args.procesos)
+    print_table(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+from typing import Optional
+
+import numpy as np
+
+from lotes import DEFAULT_BATCH_ELEMENTS, run_batches
+
+ALTERNATIVES = ("two-sided", "greater", "less")
+
+
+# Núcleos: generan un lote de permutaciones como matriz y devuelven el estadístico de cada fila
+
+def _mean_difference_kernel(data, size: int, rng) -> np.ndarray:
+    pooled, n_first = data
+    n = len(pooled)
+    total = pooled.sum()
+    # Cada fila es una permutación; basta sumar los primeros n_first valores
+    indices = rng.permuted(np.tile(np.arange(n), (size, 1)), axis=1)[:, :n_first]
+    first = pooled[indices].sum(axis=1)
+    return first / n_first - (total - first) / (n - n_first)
+
+
+def _correlation_kernel(data, size: int, rng) -> np.ndarray:
+    x, y = data
+    # x e y ya están centrados y normalizados: r es un producto matriz-vector
+    indices = rng.permuted(np.tile(np.arange(len(y)), (size, 1)), axis=1)
+    return y[indices] @ x
+
+
+def _sign_flip_kernel(data, size: int, rng) -> np.ndarray:
+    (differences,) = data
+    signs = rng.integers(0, 2, size=(size, len(differences))).astype(np.float64) * 2 - 1
+    return signs @ differences / len(differences)
+
+
+def _count_extreme(values: np.ndarray, observed: float, alternative: str) -> int:
+    # Tolerancia relativa para que los empates numéricos cuenten como extremos
+    tolerance = 1e-12 * max(abs(observed), 1.0)
+    if alternative == "greater":
+        return int(np.count_nonzero(values >= observed - tolerance))
+    if alternative == "less":
+        return int(np.count_nonzero(values <= observed + tolerance))
+    return int(np.count_nonzero(np.abs(values) >= abs(observed) - tolerance))
+
+
+def _run_task(data, sizes, rng, kernel, observed: float, alternative: str) -> int:
+    return sum(_count_extreme(kernel(data, size, rng), observed, alternative) for size in sizes)
+
+
+def _permutation_test(kernel, data, n: int, observed: float, n_permutations: int,
+                      alternative: str, workers: Optional[int], seed: Optional[int],
+                      batch_elements: int, tasks: int = 16) -> dict:
+    if alternative not in ALTERNATIVES:
+        raise ValueError("alternative debe ser 'two-sided', 'greater' o 'less'")
+
+    extreme = sum(run_batches(_run_task, data, n_permutations, n, (kernel, observed, alternative),
+                              workers, seed, batch_elements, tasks))
+
+    # La muestra observada cuenta como una permutación más: p nunca es 0
+    return {
+        "estimate": observed,
+        "p": (extreme + 1) / (n_permutations + 1),
+        "n_permutations": n_permutations,
+        "alternative": alternative
+    }
+
+
+def mean_difference_test(first, second, n_permutations: int = 10_000,
+                         alternative: str = "two-sided", workers: Optional[int] = 1,
+                         seed: Optional[int] = None,
+                         batch_elements: int = DEFAULT_BATCH_ELEMENTS) -> dict:
+    """Prueba de permutación de la diferencia de medias de dos grupos independientes"""
+    first = np.asarray(first, dtype=np.float64)
+    second = np.asarray(second, dtype=np.float64)
+    if not len(first) or not len(second):
+        raise ValueError("Ambos grupos deben tener datos")
+
+    pooled = np.concatenate((first, second))
+    observed = float(first.mean() - second.mean())
+    return _permutation_test(_mean_difference_kernel, (pooled, len(first)), len(pooled), observed,
+                             n_permutations, alternative, workers, seed, batch_elements)
+
+
+def correlation_test(x, y, n_permutations: int = 10_000, alternative: str = "two-sided",
+                     workers: Optional[int] = 1, seed: Optional[int] = None,
+                     batch_elements: int = DEFAULT_BATCH_ELEMENTS) -> dict:
+    """Prueba de permutación de la correlación de Pearson (se permuta Y respecto de X)"""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if x.shape != y.shape:
+        raise ValueError("X e Y deben tener la misma longitud")
+
+    x = x - x.mean()
+    y = y - y.mean()
+    scale_x = np.sqrt(x @ x)
+    scale_y = np.sqrt(y @ y)
+    if not scale_x or not scale_y:
+        raise ValueError("X e Y no pueden ser constantes")
+    x /= scale_x
+    y /= scale_y
+
+    observed = float(x @ y)
+    return _permutation_test(_correlation_kernel, (x, y), len(x), observed,
+                             n_permutations, alternative, workers, seed, batch_elements)
+
+
+def sign_flip_test(values, mu0: float = 0.0, n_permutations: int = 10_000,
+                   alternative: str = "two-sided", workers: Optional[int] = 1,
+                   seed: Optional[int] = None,
+                   batch_elements: int = DEFAULT_BATCH_ELEMENTS) -> dict:
+    """Prueba de una muestra (o pareada) por cambios de signo de values - mu0
+
+    Supone simetría alrededor de mu0; es la alternativa sin normalidad a la t de una muestra.
+    """
+    differences = np.asarray(values, dtype=np.float64) - mu0
+    if not len(differences):
+        raise ValueError("No hay datos")
+
+    observed = float(differences.mean())
+    result = _permutation_test(_sign_flip_kernel, (differences,), len(differences), observed,
+                               n_permutations, alternative, workers, seed, batch_elements)
+    result["estimate"] = observed + mu0
+    return result
@@ -0,0 +1,274 @@
+import math
+from typing import Optional, Sequence
+
+import numpy as np
+from scipy import stats
+
+
+def summarize(groups) -> tuple:
+    """(n, media, varianza muestral) de cada grupo
+
+    groups puede ser un array 2-D (comparaciones, observaciones) con NaN como
+    relleno o una lista de arrays de distinto largo.
+    """
+    if isinstance(groups, np.ndarray) and groups.ndim == 2:
+        values = groups.astype(np.float64, copy=False)
+        n = np.count_nonzero(~np.isnan(values), axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = np.nansum(values, axis=1) / n
+            variances = np.nansum((values - means[:, np.newaxis]) ** 2, axis=1) / (n - 1)
+        return n, means, variances
+
+    # Grupos de distinto largo: todo concatenado y sumas por segmento con reduceat
+    arrays = [np.asarray(group, dtype=np.float64) for group in groups]
+    arrays = [group[~np.isnan(group)] for group in arrays]
+    n = np.array([len(group) for group in arrays])
+    means = np.full(len(arrays), np.nan)
+    variances = np.full(len(arrays), np.nan)
+
+    present = n > 0
+    if present.any():
+        values = np.concatenate([group for group in arrays if len(group)])
+        counts = n[present]
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        group_means = np.add.reduceat(values, starts) / counts
+        squares = np.add.reduceat((values - np.repeat(group_means, counts)) ** 2, starts)
+        means[present] = group_means
+        with np.errstate(invalid="ignore", divide="ignore"):
+            variances[present] = squares / (counts - 1)
+    return n, means, variances
+
+
+def _finish(estimate, standard_error, df, confidence: float, null: float = 0.0) -> dict:
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t = (estimate - null) / standard_error
+    p = 2 * stats.t.sf(np.abs(t), df)
+    margin = stats.t.ppf(1 - (1 - confidence) / 2, df) * standard_error
+    return {
+        "estimacion": estimate,
+        "error_estandar": standard_error,
+        "t": t,
+        "gl": df,
+        "p": p,
+        "inferior": estimate - margin,
+        "superior": estimate + margin
+    }
+
+
+def one_sample_from_stats(n, mean, variance, mu0=0.0, confidence: float = 0.95) -> dict:
+    """Prueba t de una muestra para vectores de estadísticos suficientes"""
+    n = np.asarray(n, dtype=np.float64)
+    mean = np.asarray(mean, dtype=np.float64)
+    variance = np.asarray(variance, dtype=np.float64)
+    standard_error = np.sqrt(variance / n)
+    return _finish(mean, standard_error, n - 1, confidence, mu0)
+
+
+def welch_from_stats(n1, mean1, variance1, n2, mean2, variance2,
+                     confidence: float = 0.95) -> dict:
+    """Prueba t de Welch (varianzas distintas) para vectores de estadísticos"""
+    n1, mean1, variance1, n2, mean2, variance2 = (
+        np.asarray(value, dtype=np.float64) for value in (n1, mean1, variance1, n2, mean2, variance2))
+    term1 = variance1 / n1
+    term2 = variance2 / n2
+    standard_error = np.sqrt(term1 + term2)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Grados de libertad de Welch-Satterthwaite
+        df = (term1 + term2) ** 2 / (term1 ** 2 / (n1 - 1) + term2 ** 2 / (n2 - 1))
+    return _finish(mean1 - mean2, standard_error, df, confidence)
+
+
+def adjust_p_values(p, method: str = "bh") -> np.ndarray:
+    """Corrección por comparaciones múltiples: 'bonferroni', 'holm' o 'bh' (Benjamini-Hochberg)"""
+    p = np.asarray(p, dtype=np.float64)
+    adjusted = np.full(p.shape, np.nan)
+    valid = ~np.isnan(p)
+    values = p[valid]
+    m = len(values)
+    if not m:
+        return adjusted
+
+    if method == "bonferroni":
+        result = np.minimum(values * m, 1.0)
+    elif method == "holm":
+        order = np.argsort(values)
+        stepped = np.maximum.accumulate(values[order] * (m - np.arange(m)))
+        result = np.empty(m)
+        result[order] = np.minimum(stepped, 1.0)
+    elif method == "bh":
+        order = np.argsort(values)[::-1]
+        ranks = m - np.arange(m)
+        stepped = np.minimum.accumulate(values[order] * m / ranks)
+        result = np.empty(m)
+        result[order] = np.minimum(stepped, 1.0)
+    else:
+        raise ValueError("method debe ser 'bonferroni', 'holm' o 'bh'")
+
+    adjusted[valid] = result
+    return adjusted
+
+
+def _with_correction(result: dict, alpha: float, correction: Optional[str]) -> dict:
+    p = result["p"] if correction is None else adjust_p_values(result["p"], correction)
+    result["p_ajustado"] = p
+    result["rechaza"] = p < alpha
+    return result
+
+
+def one_sample_test(groups, mu0=0.0, confidence: float = 0.95, alpha: float = 0.05,
+                    correction: Optional[str] = "bh") -> dict:
+    """Una prueba t de una muestra por grupo, todas a la vez"""
+    n, means, variances = summarize(groups)
+    result = one_sample_from_stats(n, means, variances, mu0, confidence)
+    result["n"] = n
+    return _with_correction(result, alpha, correction)
+
+
+def welch_test(groups_a, groups_b, confidence: float = 0.95, alpha: float = 0.05,
+               correction: Optional[str] = "bh") -> dict:
+    """Comparaciones A/B: grupos_a[i] contra grupos_b[i] con la prueba de Welch"""
+    n1, means1, variances1 = summarize(groups_a)
+    n2, means2, variances2 = summarize(groups_b)
+    if len(n1) != len(n2):
+        raise ValueError("Debe haber el mismo número de grupos A y B")
+    result = welch_from_stats(n1, means1, variances1, n2, means2, variances2, confidence)
+    result["n_a"], result["n_b"] = n1, n2
+    return _with_correction(result, alpha, correction)
+
+
+def paired_test(groups_a, groups_b, confidence: float = 0.95, alpha: float = 0.05,
+                correction: Optional[str] = "bh") -> dict:
+    """Pruebas t pareadas: se analizan las diferencias a - b de cada comparación"""
+    if isinstance(groups_a, np.ndarray) and groups_a.ndim == 2:
+        differences = groups_a - np.asarray(groups_b)
+    else:
+        differences = []
+        for a, b in zip(groups_a, groups_b):
+            a = np.asarray(a, dtype=np.float64)
+            b = np.asarray(b, dtype=np.float64)
+            if a.shape != b.shape:
+                raise ValueError("Las muestras pareadas deben tener el mismo largo")
+            differences.append(a - b)
+    return one_sample_test(differences, 0.0, confidence, alpha, correction)
+
+
+def to_table(result: dict, names: Optional[Sequence[str]] = None):
+    """Resultado como DataFrame de pandas (importado sólo aquí)"""
+    import pandas as pd
+
+    columns = {key: value for key, value in result.items() if np.ndim(value) == 1}
+    return pd.DataFrame(columns, index=names)
+
+
+class OnlineMoments:
+    """Media y varianza por bloques (Welford/Chan) sin guardar las muestras"""
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, values) -> 'OnlineMoments':
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if not values.size:
+            return self
+
+        chunk = OnlineMoments()
+        chunk.n = values.size
+        chunk.mean = float(values.mean())
+        chunk.m2 = float(np.sum((values - chunk.mean) ** 2))
+        return self.merge(chunk)
+
+    def merge(self, other: 'OnlineMoments') -> 'OnlineMoments':
+        if not other.n:
+            return self
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.n * other.n / n
+        self.mean += delta * other.n / n
+        self.n = n
+        return self
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.n - 1) if self.n > 1 else math.nan
+
+
+class SequentialTTest:
+    """Prueba t de una o dos muestras que se actualiza bloque a bloque
+
+    Además del t clásico (válido sólo con n fijo) calcula un valor p siempre
+    válido con la prueba mSPRT de mezcla normal (Johari et al., 2017): se puede
+    mirar tras cada bloque y detener en cuanto p ≤ alpha sin inflar el error tipo I.
+    tau es el tamaño de efecto de la mezcla en desviaciones estándar.
+    """
+
+    def __init__(self, mu0: float = 0.0, alpha: float = 0.05, tau: float = 0.5,
+                 two_sample: bool = False, confidence: float = 0.95):
+        self.mu0 = mu0
+        self.alpha = alpha
+        self.tau = tau
+        self.two_sample = two_sample
+        self.confidence = confidence
+        self.a = OnlineMoments()
+        self.b = OnlineMoments()
+        self.p_always_valid = 1.0
+        self.batches = 0
+
+    def update(self, batch, batch_b=None) -> dict:
+        """Agrega un bloque (y el del grupo B si es de dos muestras); devuelve el estado"""
+        if self.two_sample and batch_b is None:
+            raise ValueError("La prueba de dos muestras necesita también el bloque del grupo B")
+        self.a.update(batch)
+        if self.two_sample:
+            self.b.update(batch_b)
+        self.batches += 1
+        return self.status()
+
+    def status(self) -> dict:
+        if self.two_sample:
+            if self.a.n < 2 or self.b.n < 2:
+                return self._empty()
+            result = welch_from_stats(self.a.n, self.a.mean, self.a.variance,
+                                      self.b.n, self.b.mean, self.b.variance, self.confidence)
+            # Varianza de una observación para escalar la mezcla: combinada de ambos grupos
+            unit_variance = (self.a.m2 + self.b.m2) / (self.a.n + self.b.n - 2)
+        else:
+            if self.a.n < 2:
+                return self._empty()
+            result = one_sample_from_stats(self.a.n, self.a.mean, self.a.variance,
+                                           self.mu0, self.confidence)
+            unit_variance = self.a.variance
+
+        result = {key: float(value) for key, value in result.items()}
+        effect = result["estimacion"] - (0.0 if self.two_sample else self.mu0)
+        variance = result["error_estandar"] ** 2
+        mixture = self.tau ** 2 * unit_variance
+
+        if variance > 0 and mixture > 0:
+            # Razón de verosimilitud de la mezcla en escala log
+            log_lambda = (0.5 * math.log(variance / (variance + mixture))
+                          + mixture * effect ** 2 / (2 * variance * (variance + mixture)))
+            self.p_always_valid = min(self.p_always_valid, math.exp(-log_lambda) if log_lambda > 0 else 1.0)
+
+        result.update({
+            "n": self.a.n,
+            "n_b": self.b.n if self.two_sample else None,
+            "lotes": self.batches,
+            "p_siempre_valido": self.p_always_valid,
+            # Con el p siempre válido, rechazar ya es razón suficiente para detener
+            "rechaza": self.p_always_valid <= self.alpha
+        })
+        return result
+
+    def _empty(self) -> dict:
+        return {
+            "n": self.a.n,
+            "n_b": self.b.n if self.two_sample else None,
+            "lotes": self.batches,
+            "t": math.nan,
+            "p": math.nan,
+            "p_siempre_valido": self.p_always_valid,
+            "rechaza": False
+        }
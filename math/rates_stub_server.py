@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+import json
+import threading
+import time
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from converter import CurrencyConverter
+
+# Tasas fijas respecto a USD; las demás bases se derivan de ellas
+USD_RATES = {
+    "USD": 1.0, "EUR": 0.92, "GBP": 0.79, "JPY": 151.6, "CAD": 1.36,
+    "AUD": 1.52, "CHF": 0.90, "CNY": 7.23, "MXN": 16.9, "COP": 3920.0,
+    "BRL": 5.05, "ARS": 870.0, "CLP": 945.0, "PEN": 3.71, "INR": 83.4,
+    "KRW": 1345.0, "SEK": 10.6, "NOK": 10.8, "NZD": 1.66, "ZAR": 18.7
+}
+
+
+class RatesHandler(BaseHTTPRequestHandler):
+    """Imita GET /v4/latest/<BASE> de exchangerate-api.com"""
+
+    protocol_version = "HTTP/1.1"
+    # Cabeceras y cuerpo van en escrituras separadas; sin esto Nagle añade ~40 ms
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.server.request_count += 1
+        if self.server.delay:
+            time.sleep(self.server.delay)
+
+        base = self.path.rstrip("/").rsplit("/", 1)[-1].upper()
+        if not self.path.startswith("/v4/latest/") or base not in USD_RATES:
+            self.send_json(404, {"error": f"Moneda desconocida: {base}"})
+            return
+
+        rates = {code: rate / USD_RATES[base] for code, rate in USD_RATES.items()}
+        self.send_json(200, {"base": base, "date": date.today().isoformat(), "rates": rates})
+
+    def send_json(self, status: int, payload: dict):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server(port: int = 0, delay: float = 0.0):
+    """Arranca el servidor en un hilo; devuelve (servidor, base_url)"""
+    server = ThreadingHTTPServer(("127.0.0.1", port), RatesHandler)
+    server.daemon_threads = True
+    server.delay = delay
+    server.request_count = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}/v4/latest/"
+
+
+def benchmark(delay: float = 0.05):
+    """Compara descargas secuenciales contra refresh_many con peticiones coalescidas"""
+    server, base_url = start_stub_server(delay=delay)
+    bases = list(USD_RATES)
+
+    try:
+        with CurrencyConverter(cache_file=None, base_url=base_url) as converter:
+            start = time.perf_counter()
+            for base in bases:
+                converter._fetch(base)
+            sequential = time.perf_counter() - start
+
+        with CurrencyConverter(cache_file=None, base_url=base_url) as converter:
+            requests_before = server.request_count
+            start = time.perf_counter()
+            # Cada base pedida dos veces: la segunda comparte la petición en vuelo
+            converter.refresh_rates(bases + bases)
+            concurrent = time.perf_counter() - start
+            requests_made = server.request_count - requests_before
+    finally:
+        server.shutdown()
+
+    print(f"Monedas base: {len(bases)} (latencia simulada {delay * 1000:.0f} ms)")
+    print(f"Secuencial: {sequential:.3f} s")
+    print(f"Asíncrono con pool: {concurrent:.3f} s ({requests_made} peticiones para {len(bases) * 2} llamadas)")
+    print(f"Aceleración: {sequential / concurrent:.1f}x")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -1,49 +1,156 @@
+import argparse
+from typing import Optional
+
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-from scipy import stats
-
-# Datos
-edad = np.array([25, 46, 58, 37, 55, 32, 41, 50, 23, 60])
-ausentismo = np.array([18, 12, 8, 15, 10, 13, 7, 9, 16, 6])
-
-# Cálculos intermedios
-n = len(edad)
-xy = edad * ausentismo
-x2 = edad ** 2
-y2 = ausentismo ** 2
-
-# Tabla de datos
-df = pd.DataFrame({
-    "Edad (X)": edad,
-    "Ausentismo (Y)": ausentismo,
-    "X*Y": xy,
-    "X^2": x2,
-    "Y^2": y2
-})
-
-# Agregar sumatorias al final
-suma_fila = pd.DataFrame(df.sum(), columns=["Total"]).T
-df = pd.concat([df, suma_fila], ignore_index=True)
-
-# Regresión lineal
-slope, intercept, r_value, p_value, std_err = stats.linregress(edad, ausentismo)
-
-# Ecuación de regresión
-print(f"Ecuación de regresión: Y = {intercept:.2f} + {slope:.2f}X")
-print(f"Coeficiente de correlación (r): {r_value:.3f}")
-print(f"Coeficiente de determinación (R^2): {r_value**2:.3f}")
-
-# Mostrar tabla
-print("\nTabla con sumatorias:")
-print(df)
-
-# Gráfica
-plt.scatter(edad, ausentismo, color='blue', label='Datos reales')
-plt.plot(edad, intercept + slope * edad, color='red', label='Recta de regresión')
-plt.title('Relación entre Edad y Ausentismo')
-plt.xlabel('Edad (años)')
-plt.ylabel('Ausentismo (días por año)')
-plt.legend()
-plt.grid(True)
-plt.show()
+
+from regresion import OnlineRegression, theil_sen
+
+# Datos de ejemplo: edad (años) y ausentismo (días por año)
+EDAD = np.array([25, 46, 58, 37, 55, 32, 41, 50, 23, 60])
+AUSENTISMO = np.array([18, 12, 8, 15, 10, 13, 7, 9, 16, 6])
+
+
+def regression(x, y) -> dict:
+    """Regresión lineal simple de datos en memoria (mismos valores que scipy.stats.linregress)"""
+    return OnlineRegression().update(x, y).result()
+
+
+def regression_from_file(path: str, x_column: str, y_column: str, sample: int = 10_000,
+                         seed: Optional[int] = None) -> tuple:
+    """Regresión por bloques de un archivo grande, con memoria acotada
+
+    En una sola pasada se acumula la regresión y se guarda una muestra aleatoria
+    para la gráfica. Devuelve (acumulador, x de la muestra, y de la muestra).
+    """
+    from cargador import iter_columns, reservoir_sample
+
+    accumulator = OnlineRegression()
+
+    def chunks():
+        for chunk in iter_columns(path, [x_column, y_column]):
+            accumulator.update(chunk[x_column], chunk[y_column])
+            yield chunk
+
+    drawn = reservoir_sample(chunks(), sample, seed)
+    return accumulator, drawn.get(x_column, np.empty(0)), drawn.get(y_column, np.empty(0))
+
+
+def sums_table(x, y):
+    """Tabla de X, Y, X*Y, X², Y² con la fila de sumatorias (pandas se importa aquí)"""
+    import pandas as pd
+
+    x = np.asarray(x)
+    y = np.asarray(y)
+    table = pd.DataFrame({
+        "Edad (X)": x,
+        "Ausentismo (Y)": y,
+        "X*Y": x * y,
+        "X^2": x ** 2,
+        "Y^2": y ** 2
+    })
+
+    # Agregar sumatorias al final
+    totals = pd.DataFrame(table.sum(), columns=["Total"]).T
+    return pd.concat([table, totals], ignore_index=True)
+
+
+def totals_table(accumulator: OnlineRegression):
+    """Sólo la fila de sumatorias, reconstruida del acumulador"""
+    import pandas as pd
+
+    sums = accumulator.sums()
+    return pd.DataFrame({
+        "n": [sums["n"]],
+        "ΣX": [sums["sum_x"]],
+        "ΣY": [sums["sum_y"]],
+        "ΣX*Y": [sums["sum_xy"]],
+        "ΣX^2": [sums["sum_x2"]],
+        "ΣY^2": [sums["sum_y2"]]
+    }, index=["Total"])
+
+
+def plot_regression(x, y, result: dict, output: str,
+                    title: str = "Relación entre Edad y Ausentismo",
+                    x_label: str = "Edad (años)",
+                    y_label: str = "Ausentismo (días por año)",
+                    robust: Optional[dict] = None) -> str:
+    """Guarda la dispersión y la recta en un archivo
+
+    Se usa matplotlib.figure.Figure sin pyplot: el renderizado es Agg y no
+    hace falta pantalla, así que funciona en nodos sin interfaz gráfica.
+    """
+    from matplotlib.figure import Figure
+
+    x = np.asarray(x)
+    figure = Figure()
+    axes = figure.subplots()
+    axes.scatter(x, y, color="blue", label="Datos reales")
+    line_x = np.array([x.min(), x.max()]) if len(x) else x
+    axes.plot(line_x, result["intercept"] + result["slope"] * line_x, color="red",
+              label="Recta de regresión")
+    if robust:
+        axes.plot(line_x, robust["intercept"] + robust["slope"] * line_x, color="green",
+                  linestyle="--", label="Recta de Theil-Sen")
+    axes.set_title(title)
+    axes.set_xlabel(x_label)
+    axes.set_ylabel(y_label)
+    axes.legend()
+    axes.grid(True)
+    figure.savefig(output)
+    return output
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Regresión lineal simple (por defecto, edad vs ausentismo)")
+    parser.add_argument("archivo", nargs="?", help="CSV o Parquet con los datos (se lee por bloques)")
+    parser.add_argument("--x", default="edad", help="Columna de la variable independiente")
+    parser.add_argument("--y", default="ausentismo", help="Columna de la variable dependiente")
+    parser.add_argument("--muestra", type=int, default=10_000, help="Puntos a graficar de un archivo")
+    parser.add_argument("--bootstrap", type=int, default=0,
+                        help="Remuestreos para intervalos BCa de pendiente y R^2 (0 = no calcular)")
+    parser.add_argument("--procesos", type=int, default=None, help="Procesos para el bootstrap")
+    parser.add_argument("--robusta", action="store_true",
+                        help="Agregar la recta robusta de Theil-Sen (sobre la muestra si es un archivo)")
+    parser.add_argument("--tabla", action="store_true", help="Mostrar la tabla con sumatorias")
+    parser.add_argument("--grafica", metavar="ARCHIVO",
+                        help="Guardar la gráfica en este archivo (png, svg, pdf...)")
+    args = parser.parse_args(argv)
+
+    if args.archivo:
+        accumulator, x, y = regression_from_file(args.archivo, args.x, args.y, args.muestra)
+        result = accumulator.result()
+    else:
+        x, y = EDAD, AUSENTISMO
+        result = regression(x, y)
+
+    # Ecuación de regresión
+    print(f"Ecuación de regresión: Y = {result['intercept']:.2f} + {result['slope']:.2f}X")
+    print(f"Coeficiente de correlación (r): {result['r']:.3f}")
+    print(f"Coeficiente de determinación (R^2): {result['r2']:.3f}")
+
+    # Recta robusta: mediana de las pendientes de todos los pares, resistente a atípicos
+    robusta = None
+    if args.robusta:
+        robusta = theil_sen(x, y, seed=0)
+        print(f"Recta de Theil-Sen: Y = {robusta['intercept']:.2f} + {robusta['slope']:.2f}X "
+              f"(IC 95% de la pendiente: [{robusta['low_slope']:.3f}, {robusta['high_slope']:.3f}])")
+
+    # Intervalos bootstrap (sobre la muestra si los datos vienen de un archivo)
+    if args.bootstrap:
+        from bootstrap import r_squared_ci, slope_ci
+
+        ic_pendiente = slope_ci(x, y, n_resamples=args.bootstrap, workers=args.procesos, seed=0)
+        ic_r2 = r_squared_ci(x, y, n_resamples=args.bootstrap, workers=args.procesos, seed=0)
+        print(f"IC 95% bootstrap de la pendiente: [{ic_pendiente['low']:.3f}, {ic_pendiente['high']:.3f}]")
+        print(f"IC 95% bootstrap de R^2: [{ic_r2['low']:.3f}, {ic_r2['high']:.3f}]")
+
+    if args.tabla:
+        print("\nTabla con sumatorias:")
+        print(totals_table(accumulator) if args.archivo else sums_table(x, y))
+
+    if args.grafica:
+        print(f"\nGráfica guardada en {plot_regression(x, y, result, args.grafica, robust=robusta)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,450 @@
+import math
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+class OnlineRegression:
+    """Regresión lineal simple por bloques, combinable entre procesos
+
+    Guarda estadísticos suficientes en forma centrada (Welford/Chan):
+    n, medias de X e Y, Σ(x - x̄)², Σ(y - ȳ)² y Σ(x - x̄)(y - ȳ).
+    Nunca conserva los datos.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.m2_x = 0.0
+        self.m2_y = 0.0
+        self.c_xy = 0.0
+
+    def update(self, x, y) -> 'OnlineRegression':
+        """Agrega un bloque de observaciones"""
+        x = np.asarray(x, dtype=np.float64).ravel()
+        y = np.asarray(y, dtype=np.float64).ravel()
+        if x.shape != y.shape:
+            raise ValueError("X e Y deben tener la misma longitud")
+        if not x.size:
+            return self
+
+        # Estadísticos del bloque centrados en su propia media, luego se combinan
+        chunk = OnlineRegression()
+        chunk.n = x.size
+        chunk.mean_x = float(x.mean())
+        chunk.mean_y = float(y.mean())
+        dx = x - chunk.mean_x
+        dy = y - chunk.mean_y
+        chunk.m2_x = float(dx @ dx)
+        chunk.m2_y = float(dy @ dy)
+        chunk.c_xy = float(dx @ dy)
+        return self.merge(chunk)
+
+    def merge(self, other: 'OnlineRegression') -> 'OnlineRegression':
+        """Combina otro acumulador en este (fórmula de Chan et al.)"""
+        if not other.n:
+            return self
+        if not self.n:
+            self.__dict__.update(other.__dict__)
+            return self
+
+        n = self.n + other.n
+        delta_x = other.mean_x - self.mean_x
+        delta_y = other.mean_y - self.mean_y
+        weight = self.n * other.n / n
+
+        self.m2_x += other.m2_x + delta_x * delta_x * weight
+        self.m2_y += other.m2_y + delta_y * delta_y * weight
+        self.c_xy += other.c_xy + delta_x * delta_y * weight
+        self.mean_x += delta_x * other.n / n
+        self.mean_y += delta_y * other.n / n
+        self.n = n
+        return self
+
+    def sums(self) -> dict:
+        """Sumatorias clásicas (Σx, Σy, Σxy, Σx², Σy²) reconstruidas"""
+        n = self.n
+        return {
+            "n": n,
+            "sum_x": n * self.mean_x,
+            "sum_y": n * self.mean_y,
+            "sum_xy": self.c_xy + n * self.mean_x * self.mean_y,
+            "sum_x2": self.m2_x + n * self.mean_x ** 2,
+            "sum_y2": self.m2_y + n * self.mean_y ** 2
+        }
+
+    def result(self) -> dict:
+        """Mismos valores que scipy.stats.linregress"""
+        if self.n < 2 or self.m2_x == 0:
+            raise ValueError("Se necesitan al menos 2 valores distintos de X")
+
+        slope = self.c_xy / self.m2_x
+        intercept = self.mean_y - slope * self.mean_x
+        r = self.c_xy / math.sqrt(self.m2_x * self.m2_y) if self.m2_y else 0.0
+        r = max(-1.0, min(1.0, r))
+
+        df = self.n - 2
+        if df > 0:
+            std_err = math.sqrt(max(0.0, (1 - r * r) * self.m2_y / self.m2_x / df))
+            intercept_stderr = std_err * math.sqrt(self.m2_x / self.n + self.mean_x ** 2)
+        else:
+            std_err = intercept_stderr = 0.0
+
+        if df <= 0 or abs(r) == 1.0:
+            p_value = 0.0 if abs(r) == 1.0 and df > 0 else 1.0
+        else:
+            from scipy import stats
+            t_stat = r * math.sqrt(df / ((1 - r) * (1 + r)))
+            p_value = float(2 * stats.t.sf(abs(t_stat), df))
+
+        return {
+            "n": self.n,
+            "slope": slope,
+            "intercept": intercept,
+            "r": r,
+            "r2": r * r,
+            "p": p_value,
+            "std_err": std_err,
+            "intercept_stderr": intercept_stderr
+        }
+
+    def to_dict(self) -> dict:
+        return dict(self.__dict__)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'OnlineRegression':
+        accumulator = cls()
+        accumulator.__dict__.update(data)
+        return accumulator
+
+
+class MultipleRegression:
+    """Regresión lineal múltiple por bloques sin materializar la matriz de diseño
+
+    Acumula n, el vector de medias de z = [x₁..xₚ, y] y la matriz de co-momentos
+    centrados C = Σ(z - z̄)(z - z̄)ᵀ, que es la matriz de Gram (XᵀX, Xᵀy) centrada.
+    La memoria es O(p²) sin importar cuántas filas se procesen.
+    """
+
+    def __init__(self, n_features: int):
+        self.n_features = n_features
+        self.n = 0
+        self.mean = np.zeros(n_features + 1)
+        self.comoment = np.zeros((n_features + 1, n_features + 1))
+
+    def update(self, X, y) -> 'MultipleRegression':
+        """Agrega un bloque: X de forma (filas, p) e y de forma (filas,)"""
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64).ravel()
+        if X.ndim == 1:
+            X = X[:, np.newaxis]
+        if X.shape != (y.size, self.n_features):
+            raise ValueError(f"Se esperaba X de forma ({y.size}, {self.n_features})")
+        if not y.size:
+            return self
+
+        chunk = MultipleRegression(self.n_features)
+        chunk.n = y.size
+        Z = np.column_stack((X, y))
+        chunk.mean = Z.mean(axis=0)
+        Z -= chunk.mean
+        chunk.comoment = Z.T @ Z
+        return self.merge(chunk)
+
+    def merge(self, other: 'MultipleRegression') -> 'MultipleRegression':
+        """Combina otro acumulador en este (versión matricial de Chan et al.)"""
+        if other.n_features != self.n_features:
+            raise ValueError("Los acumuladores tienen distinto número de variables")
+        if not other.n:
+            return self
+        if not self.n:
+            self.n = other.n
+            self.mean = other.mean.copy()
+            self.comoment = other.comoment.copy()
+            return self
+
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.comoment = self.comoment + other.comoment + np.outer(delta, delta) * (self.n * other.n / n)
+        self.mean = self.mean + delta * (other.n / n)
+        self.n = n
+        return self
+
+    def result(self) -> dict:
+        """Coeficientes, errores estándar, estadísticos t, valores p y R²"""
+        p = self.n_features
+        df = self.n - p - 1
+        if df <= 0:
+            raise ValueError(f"Se necesitan más de {p + 1} observaciones")
+
+        cxx = self.comoment[:p, :p]
+        cxy = self.comoment[:p, p]
+        cyy = self.comoment[p, p]
+        mean_x = self.mean[:p]
+
+        # Cholesky de la Gram centrada; si no es definida positiva, mínimos cuadrados
+        try:
+            inverse_factor = np.linalg.solve(np.linalg.cholesky(cxx), np.eye(p))
+            cxx_inverse = inverse_factor.T @ inverse_factor
+        except np.linalg.LinAlgError:
+            cxx_inverse = np.linalg.pinv(cxx)
+
+        coefficients = cxx_inverse @ cxy
+        intercept = self.mean[p] - mean_x @ coefficients
+
+        sse = max(0.0, float(cyy - coefficients @ cxy))
+        r2 = 1 - sse / cyy if cyy else 0.0
+        sigma2 = sse / df
+
+        std_errors = np.sqrt(np.maximum(np.diag(cxx_inverse) * sigma2, 0.0))
+        intercept_stderr = math.sqrt(max(0.0, sigma2 * (1 / self.n + mean_x @ cxx_inverse @ mean_x)))
+
+        from scipy import stats
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t_values = coefficients / std_errors
+            intercept_t = intercept / intercept_stderr if intercept_stderr else math.inf
+        p_values = 2 * stats.t.sf(np.abs(t_values), df)
+        intercept_p = float(2 * stats.t.sf(abs(intercept_t), df))
+
+        return {
+            "n": self.n,
+            "coefficients": coefficients,
+            "intercept": float(intercept),
+            "std_errors": std_errors,
+            "intercept_stderr": intercept_stderr,
+            "t_values": t_values,
+            "intercept_t": intercept_t,
+            "p_values": p_values,
+            "intercept_p": intercept_p,
+            "r2": r2,
+            "r2_adjusted": 1 - (1 - r2) * (self.n - 1) / df,
+            "sigma": math.sqrt(sigma2)
+        }
+
+
+def _slope_ranks(x: np.ndarray, y: np.ndarray, bound: Tuple[float, bool]) -> np.ndarray:
+    """Rango de cada punto al ordenar por u = y - t·x
+
+    Con los puntos ordenados por x, el par i < j queda invertido (j antes que i)
+    exactamente cuando su pendiente es ≤ t: contar pendientes es contar inversiones.
+    bound = (t, strict); con strict se cuenta < t (se ordena en t⁻), desempatando
+    por x creciente en lugar de comparar contra t menos un épsilon de coma flotante.
+    """
+    t, strict = bound
+    index = np.arange(len(x))
+    if t == -math.inf:
+        order = np.lexsort((-index, y, x))
+    elif t == math.inf:
+        order = np.lexsort((-index, y, -x))
+    elif strict:
+        order = np.lexsort((-index, x, y - t * x))
+    else:
+        order = np.lexsort((-index, y - t * x))
+    ranks = np.empty(len(x), dtype=np.int64)
+    ranks[order] = index
+    return ranks
+
+
+def _inversion_levels(sequence: np.ndarray):
+    """Niveles de un merge sort ascendente vectorizado
+
+    En cada nivel, para cada posición de una mitad derecha, las posiciones de la
+    mitad izquierda de su bloque con valor mayor son left[starts:ends].
+    """
+    n = len(sequence)
+    positions = np.arange(n)
+    # Posiciones ordenadas por (bloque de ancho width, valor)
+    order = positions
+    width = 1
+    while width < n:
+        block = order // (2 * width)
+        is_left = (order // width) % 2 == 0
+        left = order[is_left]
+        left_keys = block[is_left] * n + sequence[left]
+
+        right = positions[(positions // width) % 2 == 1]
+        right_block = right // (2 * width)
+        starts = np.searchsorted(left_keys, right_block * n + sequence[right], side="right")
+        ends = np.searchsorted(left_keys, (right_block + 1) * n, side="left")
+        yield left, right, starts, ends
+
+        # Cada bloque doble son dos corridas ordenadas: el sort estable las mezcla
+        keys = block * n + sequence[order]
+        order = order[np.argsort(keys, kind="stable")]
+        width *= 2
+
+
+def _count_inversions(sequence: np.ndarray) -> int:
+    return sum(int((ends - starts).sum()) for _, _, starts, ends in _inversion_levels(sequence))
+
+
+def _inversion_pairs(sequence: np.ndarray, size: Optional[int] = None, total: int = 0, rng=None):
+    """Todas las inversiones (p, q) o, con size, una muestra uniforme de unas size"""
+    firsts, seconds = [], []
+    for left, right, starts, ends in _inversion_levels(sequence):
+        counts = ends - starts
+        level_total = int(counts.sum())
+        if not level_total:
+            continue
+
+        if size is None:
+            owner = np.repeat(np.arange(len(counts)), counts)
+            offsets = np.arange(level_total) - np.repeat(np.cumsum(counts) - counts, counts)
+        else:
+            draws = rng.binomial(size, level_total / total)
+            cumulative = np.cumsum(counts)
+            picks = rng.integers(0, level_total, draws)
+            owner = np.searchsorted(cumulative, picks, side="right")
+            offsets = picks - (cumulative[owner] - counts[owner])
+
+        firsts.append(left[starts[owner] + offsets])
+        seconds.append(right[owner])
+
+    if not firsts:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(firsts), np.concatenate(seconds)
+
+
+def _select_slopes(x: np.ndarray, y: np.ndarray, targets: List[int], tie_pairs: int,
+                   total: int, rng, sample_size: int, max_candidates: int) -> List[float]:
+    """Pendientes de pares en las posiciones targets (0-based, cercanas entre sí) del orden
+
+    Selección aleatorizada: se muestrean pendientes del intervalo (lo, hi] vigente,
+    se acota con sus cuantiles y se cuentan las pendientes bajo cada cota en
+    O(n log² n), hasta que quedan pocas candidatas y se enumeran.
+    """
+    first_target, last_target = min(targets), max(targets)
+    # Cotas (t, strict) comparables como tuplas: (t, False) está justo encima de (t, True)
+    lo, hi = (-math.inf, False), (math.inf, False)
+    ranks_lo, ranks_hi = _slope_ranks(x, y, lo), _slope_ranks(x, y, hi)
+    below, upto = 0, total
+    stalled = 0
+
+    def key(bound):
+        return bound[0], not bound[1]
+
+    while True:
+        # Pares cuyo orden cambia entre lo y hi: exactamente las pendientes en (lo, hi]
+        points = np.argsort(ranks_lo)
+        sequence = ranks_hi[points]
+        candidates = upto - below
+
+        # Si el redondeo impide avanzar se enumera aunque haya más candidatas
+        if candidates <= max_candidates or stalled >= 8:
+            first, second = _inversion_pairs(sequence)
+            a, b = points[first], points[second]
+            slopes = (y[b] - y[a]) / (x[b] - x[a])
+            wanted = [target - below for target in targets]
+            slopes = np.partition(slopes, wanted)
+            return [float(slopes[k]) for k in wanted]
+
+        first, second = _inversion_pairs(sequence, min(candidates, sample_size), candidates, rng)
+        a, b = points[first], points[second]
+        sample = np.sort((y[b] - y[a]) / (x[b] - x[a]))
+        m = len(sample)
+        # ±3 desviaciones del rango muestral alrededor de los objetivos
+        spread = 1.5 * math.sqrt(m) + 1
+        low_index = math.floor(m * (first_target - below) / candidates - spread)
+        high_index = math.ceil(m * (last_target + 1 - below) / candidates + spread)
+
+        probes = []
+        if 0 <= low_index < m:
+            value = float(sample[low_index])
+            # Con muchas pendientes iguales a hi se prueba justo debajo de hi
+            probes.append((hi[0], True) if value >= hi[0] else (value, False))
+        if high_index < m:
+            probes.append((float(sample[high_index]), False))
+
+        progress = False
+        for bound in probes:
+            if not key(lo) < key(bound) < key(hi):
+                continue
+            ranks = _slope_ranks(x, y, bound)
+            count = _count_inversions(ranks) - tie_pairs
+            if count <= first_target:
+                if bound[1] and bound[0] == hi[0]:
+                    # Todas las posiciones buscadas son empates exactos con hi
+                    return [hi[0]] * len(targets)
+                lo, ranks_lo, below = bound, ranks, count
+                progress = True
+            elif count > last_target:
+                hi, ranks_hi, upto = bound, ranks, count
+                progress = True
+        stalled = 0 if progress else stalled + 1
+
+
+def theil_sen(x, y, confidence: Optional[float] = 0.95, method: str = "separate",
+              seed: Optional[int] = None, sample_size: Optional[int] = None,
+              max_candidates: Optional[int] = None) -> dict:
+    """Estimador robusto de Theil-Sen: la mediana de las pendientes de todos los pares
+
+    Mismos valores que scipy.stats.theilslopes, sin enumerar los n² pares: la
+    mediana (y las cotas del intervalo de confianza de Sen) se obtienen con
+    selección aleatorizada en tiempo esperado O(n log² n) y memoria O(n).
+    method='separate' usa mediana(y) - pendiente·mediana(x) como ordenada;
+    'joint', mediana(y - pendiente·x). sample_size y max_candidates acotan la
+    memoria de cada paso (por defecto proporcionales a n).
+    """
+    if method not in ("separate", "joint"):
+        raise ValueError("method debe ser 'separate' o 'joint'")
+
+    x = np.asarray(x, dtype=np.float64).ravel()
+    y = np.asarray(y, dtype=np.float64).ravel()
+    if x.shape != y.shape:
+        raise ValueError("X e Y deben tener la misma longitud")
+
+    # Orden por x creciente y, con x empatada, por y decreciente: así los pares con
+    # la misma x (sin pendiente) siempre cuentan como inversión y se descuentan
+    order = np.lexsort((-y, x))
+    x, y = x[order], y[order]
+    n = len(x)
+    _, groups = np.unique(x, return_counts=True)
+    tie_pairs = int(np.sum(groups * (groups - 1) // 2))
+    total = n * (n - 1) // 2 - tie_pairs
+    if total == 0:
+        raise ValueError("Se necesitan al menos 2 valores distintos de X")
+
+    rng = np.random.default_rng(seed)
+    sample_size = sample_size or min(max(n, 10_000), 1_000_000)
+    max_candidates = max_candidates or min(max(4 * n, 100_000), 10_000_000)
+
+    def select(targets):
+        return _select_slopes(x, y, targets, tie_pairs, total, rng, sample_size, max_candidates)
+
+    slope = float(np.mean(select([(total - 1) // 2, total // 2])))
+    if method == "separate":
+        intercept = float(np.median(y) - slope * np.median(x))
+    else:
+        intercept = float(np.median(y - slope * x))
+
+    result = {"n": n, "slope": slope, "intercept": intercept}
+    if confidence is not None:
+        # Intervalo de Sen: varianza de la tau de Kendall con corrección por empates
+        from scipy.special import ndtri
+
+        _, y_groups = np.unique(y, return_counts=True)
+        ties_term = (np.sum(groups * (groups - 1) * (2 * groups + 5))
+                     + np.sum(y_groups * (y_groups - 1) * (2 * y_groups + 5)))
+        sigma = math.sqrt((n * (n - 1) * (2 * n + 5) - ties_term) / 18)
+        z = ndtri(0.5 * (1 - confidence))
+        upper = min(int(round((total - z * sigma) / 2)), total - 1)
+        lower = max(int(round((total + z * sigma) / 2)) - 1, 0)
+        result["low_slope"] = select([lower])[0]
+        result["high_slope"] = select([upper])[0]
+    return result
+
+
+if __name__ == "__main__":
+    # Mismo ejemplo que regresion-lineal.py, procesado en dos bloques y combinado
+    edad = np.array([25, 46, 58, 37, 55, 32, 41, 50, 23, 60])
+    ausentismo = np.array([18, 12, 8, 15, 10, 13, 7, 9, 16, 6])
+
+    parte_a = OnlineRegression().update(edad[:4], ausentismo[:4])
+    parte_b = OnlineRegression().update(edad[4:], ausentismo[4:])
+    resultado = parte_a.merge(parte_b).result()
+
+    print(f"Ecuación de regresión: Y = {resultado['intercept']:.2f} + {resultado['slope']:.2f}X")
+    print(f"Coeficiente de correlación (r): {resultado['r']:.3f}")
+    print(f"Coeficiente de determinación (R^2): {resultado['r2']:.3f}")
+    print(f"Valor p: {resultado['p']:.4f}")
@@ -1,28 +1,102 @@
-from scipy.stats import shapiro
+import argparse
+from typing import Optional
+
 import numpy as np
 
-# Paso 1: Datos ordenados
-datos = [15.2, 14.8, 15.6, 15.0, 14.9, 15.1, 15.3]
-datos_ordenados = sorted(datos)
-
-print("📊 Datos ordenados:")
-print(datos_ordenados)
-
-# Paso 2: Media y desviación estándar
-media = np.mean(datos_ordenados)
-std = np.std(datos_ordenados, ddof=1)
-print(f"\n📈 Media: {media:.4f}")
-print(f"📉 Desviación estándar: {std:.4f}")
-
-# Estadístico de Shapiro-Wilk (lo hace la librería internamente)
-W, p_val = shapiro(datos_ordenados)
-print(f"\n🔍 Estadístico de prueba W = {W:.4f}")
-print(f"🔍 Valor p = {p_val:.4f}")
-
-# Paso 3: Comparación con valor crítico
-# OJO: los valores críticos exactos se encuentran en tablas, aquí usamos el p-value
-alfa = 0.05
-if p_val < alfa:
-    print("\n❌ Se rechaza H₀: los datos NO siguen una distribución normal.")
-else:
-    print("\n✅ No se rechaza H₀: los datos podrían seguir una distribución normal.")
+# Datos de ejemplo
+DATOS = [15.2, 14.8, 15.6, 15.0, 14.9, 15.1, 15.3]
+
+
+def load_sample(path: str, column: str, sample: int = 5000, seed: Optional[int] = None) -> np.ndarray:
+    """Muestra aleatoria uniforme de una columna de un CSV/Parquet, en una pasada
+
+    W necesita la muestra completa en memoria y scipy sólo es exacto hasta n = 5000.
+    """
+    from cargador import iter_columns, reservoir_sample
+
+    drawn = reservoir_sample(iter_columns(path, [column]), sample, seed)
+    return drawn.get(column, np.empty(0))
+
+
+def shapiro_test(values, alpha: float = 0.05) -> dict:
+    """Shapiro-Wilk de una muestra: datos ordenados, media, desviación, W, p y decisión"""
+    from scipy.stats import shapiro
+
+    ordered = np.sort(np.asarray(values, dtype=np.float64))
+    w, p = shapiro(ordered)
+    return {
+        "ordenados": ordered,
+        "media": float(np.mean(ordered)),
+        "std": float(np.std(ordered, ddof=1)),
+        "W": float(w),
+        "p": float(p),
+        "rechaza": bool(p < alpha)
+    }
+
+
+def plot_normality(values, output: str) -> str:
+    """Histograma y gráfico Q-Q guardados en un archivo (Agg, sin pantalla)"""
+    from matplotlib.figure import Figure
+    from scipy.special import ndtri
+
+    ordered = np.sort(np.asarray(values, dtype=np.float64))
+    n = len(ordered)
+    theoretical = ndtri((np.arange(1, n + 1) - 0.375) / (n + 0.25))
+
+    figure = Figure(figsize=(10, 4))
+    histogram, qq = figure.subplots(1, 2)
+    histogram.hist(ordered, bins="auto", color="steelblue")
+    histogram.set_title("Histograma")
+    qq.scatter(theoretical, ordered, s=10)
+    qq.plot(theoretical, ordered.mean() + ordered.std(ddof=1) * theoretical, color="red")
+    qq.set_title("Gráfico Q-Q normal")
+    qq.set_xlabel("Cuantiles teóricos")
+    qq.set_ylabel("Cuantiles observados")
+    figure.savefig(output)
+    return output
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Prueba de normalidad de Shapiro-Wilk")
+    parser.add_argument("archivo", nargs="?", help="CSV o Parquet con los datos (se lee por bloques)")
+    parser.add_argument("--columna", default="valor", help="Columna a analizar")
+    parser.add_argument("--muestra", type=int, default=5000,
+                        help="Tamaño de la muestra aleatoria tomada del archivo")
+    parser.add_argument("--semilla", type=int, default=None, help="Semilla de la muestra")
+    parser.add_argument("--alfa", type=float, default=0.05, help="Nivel de significancia")
+    parser.add_argument("--grafica", metavar="ARCHIVO", help="Guardar histograma y Q-Q en este archivo")
+    args = parser.parse_args(argv)
+
+    # Paso 1: Datos ordenados
+    if args.archivo:
+        datos = load_sample(args.archivo, args.columna, args.muestra, args.semilla)
+        print(f"📂 Muestra aleatoria de {len(datos)} valores de '{args.columna}'")
+    else:
+        datos = DATOS
+    resultado = shapiro_test(datos, args.alfa)
+
+    print("📊 Datos ordenados:")
+    print(resultado["ordenados"] if args.archivo else resultado["ordenados"].tolist())
+
+    # Paso 2: Media y desviación estándar
+    print(f"\n📈 Media: {resultado['media']:.4f}")
+    print(f"📉 Desviación estándar: {resultado['std']:.4f}")
+
+    # Estadístico de Shapiro-Wilk (lo hace la librería internamente)
+    print(f"\n🔍 Estadístico de prueba W = {resultado['W']:.4f}")
+    print(f"🔍 Valor p = {resultado['p']:.4f}")
+
+    # Paso 3: Comparación con valor crítico
+    # OJO: los valores críticos exactos se encuentran en tablas, aquí usamos el p-value
+    if resultado["rechaza"]:
+        print("\n❌ Se rechaza H₀: los datos NO siguen una distribución normal.")
+        print("   Para comparar medias o correlaciones usa las pruebas de permutación de permutacion.py.")
+    else:
+        print("\n✅ No se rechaza H₀: los datos podrían seguir una distribución normal.")
+
+    if args.grafica:
+        print(f"\n🖼️ Gráfica guardada en {plot_normality(datos, args.grafica)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import warnings
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from medicion import parse_size, peak_memory, time_call
+
+# Tamaños de muestra de 10 a 10^8
+DEFAULT_SIZES = [10 ** exponent for exponent in range(1, 9)]
+
+# Por encima de este n sólo se miden las variantes por bloques (10^7 float64 ≈ 80 MB por columna)
+DEFAULT_MAX_IN_MEMORY = 10_000_000
+
+# Filas por bloque en las variantes por bloques
+CHUNK_ROWS = 1_000_000
+
+# Módulos y scripts cuyo arranque en frío se mide en un proceso nuevo
+IMPORTS = ["numpy", "scipy.stats", "pandas", "matplotlib.pyplot",
+           "regresion", "normalidad", "pruebas_t", "bootstrap", "permutacion"]
+SCRIPTS = ["regresion-lineal.py", "shapiro.py", "t-student.py"]
+
+HERE = Path(__file__).resolve().parent
+
+
+def _chunked(func, n: int, chunk):
+    """Llama func(bloque) hasta cubrir n filas reutilizando el mismo bloque (memoria O(bloque))"""
+    size = len(chunk[0]) if isinstance(chunk, tuple) else len(chunk)
+    full, rest = divmod(n, size)
+    for _ in range(full):
+        func(chunk)
+    if rest:
+        func(tuple(values[:rest] for values in chunk) if isinstance(chunk, tuple) else chunk[:rest])
+
+
+def _online_regression(n: int, rng):
+    from regresion import OnlineRegression
+
+    x = rng.normal(size=min(n, CHUNK_ROWS))
+    chunk = (x, 2 * x + rng.normal(size=len(x)))
+
+    def run(_):
+        accumulator = OnlineRegression()
+        _chunked(lambda block: accumulator.update(*block), n, chunk)
+        return accumulator.result()
+    return run
+
+
+def _multiple_regression(n: int, rng):
+    from regresion import MultipleRegression
+
+    X = rng.normal(size=(min(n, CHUNK_ROWS), 3))
+    chunk = (X, X @ np.array([1.0, -2.0, 0.5]) + rng.normal(size=len(X)))
+
+    def run(_):
+        accumulator = MultipleRegression(3)
+        _chunked(lambda block: accumulator.update(*block), n, chunk)
+        return accumulator.result() if n > 4 else None
+    return run
+
+
+def _sequential_t(n: int, rng):
+    from pruebas_t import SequentialTTest
+
+    chunk = rng.normal(size=min(n, CHUNK_ROWS))
+
+    def run(_):
+        test = SequentialTTest()
+        _chunked(test.update, n, chunk)
+        return test.status()
+    return run
+
+
+def get_cases(n: int, rng, max_in_memory: int) -> dict:
+    """Funciones a medir con su entrada ya preparada: (función, argumento)"""
+    from scipy import stats
+
+    cases = {
+        "online_regression": (_online_regression(n, rng), None),
+        "multiple_regression": (_multiple_regression(n, rng), None),
+        "sequential_t": (_sequential_t(n, rng), None),
+    }
+    if n > max_in_memory:
+        return cases
+
+    from normalidad import shapiro_batch
+    from pruebas_t import one_sample_test, welch_test
+    from regresion import theil_sen
+
+    x = rng.normal(size=n)
+    y = 2 * x + rng.standard_cauchy(size=n)
+    b = rng.normal(0.1, 1.5, size=n)
+
+    cases.update({
+        "linregress_scipy": (lambda args: stats.linregress(*args), (x, y)),
+        "ttest_1samp_scipy": (lambda values: stats.ttest_1samp(values, 0.0), x) if n > 1 else None,
+        "one_sample_test": (lambda values: one_sample_test(values[np.newaxis, :]), x),
+        "welch_scipy": (lambda args: stats.ttest_ind(*args, equal_var=False), (x, b)),
+        "welch_test": (lambda args: welch_test(args[0][np.newaxis, :], args[1][np.newaxis, :]), (x, b)),
+        "shapiro_scipy": (stats.shapiro, x) if n >= 3 else None,
+        "shapiro_batch": (shapiro_batch, x),
+        # O(n log² n) frente a la enumeración O(n²) de scipy
+        "theil_sen": (lambda args: theil_sen(*args, seed=0), (x, y)) if n <= 1_000_000 else None,
+        "theilslopes_scipy": (lambda args: stats.theilslopes(args[1], args[0]), (x, y))
+        if n <= 10_000 else None,
+    })
+    return {name: case for name, case in cases.items() if case is not None}
+
+
+def startup_times(repeat: int = 3) -> list:
+    """Mejor tiempo de importar cada módulo y de correr cada script en un proceso nuevo"""
+    results = []
+    commands = [("import", name, [sys.executable, "-c", f"import {name}"]) for name in IMPORTS]
+    commands += [("script", name, [sys.executable, str(HERE / name)]) for name in SCRIPTS]
+
+    for kind, name, command in commands:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            completed = subprocess.run(command, cwd=HERE, capture_output=True)
+            best = min(best, time.perf_counter() - start)
+        if completed.returncode:
+            print(f"{kind:<7} {name:<22} falló")
+            continue
+        results.append({"tipo": kind, "nombre": name, "segundos": best})
+        print(f"{kind:<7} {name:<22} {best:>8.3f} s")
+    return results
+
+
+def run_benchmark(sizes, functions=None, min_time: float = 0.5, max_repeat: int = 20,
+                  measure_memory: bool = True, max_in_memory: int = DEFAULT_MAX_IN_MEMORY,
+                  measure_startup: bool = True, seed: int = 0) -> dict:
+    """Ejecuta todas las combinaciones y devuelve el informe"""
+    startup = startup_times() if measure_startup else []
+    results = []
+    rng = np.random.default_rng(seed)
+
+    for n in sizes:
+        cases = get_cases(n, rng, max_in_memory)
+        for name, (func, argument) in cases.items():
+            if functions and name not in functions:
+                continue
+
+            with warnings.catch_warnings():
+                # shapiro de scipy avisa que p no es exacto con n > 5000
+                warnings.simplefilter("ignore")
+                seconds, repeat = time_call(func, argument, min_time, max_repeat)
+                memory = peak_memory(func, argument) if measure_memory else None
+
+            result = {
+                "funcion": name,
+                "n": n,
+                "segundos": seconds,
+                "repeticiones": repeat,
+                "valores_por_segundo": n / seconds if seconds else 0,
+                "mb_por_segundo": (n * 8 / 1_000_000 / seconds) if seconds else 0,
+                "memoria_pico": memory
+            }
+            results.append(result)
+            print(f"{name:<20} {n:>11} "
+                  f"{result['valores_por_segundo']:>14.0f} val/s "
+                  f"{(memory or 0) / 1_000_000:>10.2f} MB pico")
+
+        del cases
+
+    return {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "plataforma": platform.platform(),
+        "arranque": startup,
+        "resultados": results
+    }
+
+
+def compare(report: dict, baseline: dict):
+    """Aceleración de cada medición respecto de un informe anterior (>1 es más rápido)"""
+    previous = {(row["funcion"], row["n"]): row for row in baseline.get("resultados", [])}
+    print(f"\n{'Función':<20} {'n':>11} {'Antes (s)':>12} {'Ahora (s)':>12} {'Aceleración':>12}")
+    for row in report["resultados"]:
+        old = previous.get((row["funcion"], row["n"]))
+        if old and row["segundos"]:
+            print(f"{row['funcion']:<20} {row['n']:>11} {old['segundos']:>12.6f} "
+                  f"{row['segundos']:>12.6f} {old['segundos'] / row['segundos']:>11.2f}x")
+
+    old_startup = {item["nombre"]: item["segundos"] for item in baseline.get("arranque", [])}
+    for item in report["arranque"]:
+        if item["nombre"] in old_startup:
+            print(f"arranque {item['nombre']:<22} {old_startup[item['nombre']]:>8.3f} s → {item['segundos']:.3f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark de regresión, Shapiro-Wilk y pruebas t (incluidas las variantes por bloques)")
+    parser.add_argument("--sizes", nargs="+", type=parse_size, default=DEFAULT_SIZES,
+                        help="Tamaños de muestra, p. ej. 10 1K 1M 100M")
+    parser.add_argument("--functions", nargs="+", default=None,
+                        help="Limitar a estas funciones")
+    parser.add_argument("--max-in-memory", type=parse_size, default=DEFAULT_MAX_IN_MEMORY,
+                        help="n máximo para las funciones que necesitan todos los datos en memoria")
+    parser.add_argument("--min-time", type=float, default=0.5,
+                        help="Tiempo mínimo acumulado por medición (s)")
+    parser.add_argument("--max-repeat", type=int, default=20,
+                        help="Repeticiones máximas por medición")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="No medir memoria pico con tracemalloc")
+    parser.add_argument("--no-startup", action="store_true",
+                        help="No medir tiempos de importación y arranque")
+    parser.add_argument("--baseline", help="Informe JSON anterior contra el que comparar")
+    parser.add_argument("--output", default="stats_benchmark.json",
+                        help="Archivo JSON de resultados")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.sizes, args.functions, args.min_time, args.max_repeat,
+                           not args.no_memory, args.max_in_memory, not args.no_startup)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n✓ Resultados guardados en {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            compare(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,36 +1,129 @@
+import argparse
+from typing import Callable, Optional
+
 import numpy as np
-from scipy import stats
 
 # Datos de duración de batería (en horas)
-duraciones = np.array([5.2, 5.9, 7.1, 4.2, 6.5, 8.5, 4.6, 6.8, 6.9, 5.8,
+DURACIONES = np.array([5.2, 5.9, 7.1, 4.2, 6.5, 8.5, 4.6, 6.8, 6.9, 5.8,
                        5.1, 6.5, 7.0, 5.3, 6.2, 5.7, 6.6, 7.5, 5.1, 6.1])
 
-# Parámetro poblacional
-media_esperada = 6.0
-nivel_confianza = 0.95
-
-# Estadísticos muestrales
-media_muestral = np.mean(duraciones)
-desv_std_muestral = np.std(duraciones, ddof=1)
-n = len(duraciones)
-grados_libertad = n - 1
-
-# Estadístico t
-error_estandar = desv_std_muestral / np.sqrt(n)
-t_stat = (media_muestral - media_esperada) / error_estandar
-
-# Valor crítico para prueba bilateral
-valor_critico = stats.t.ppf(1 - (1 - nivel_confianza)/2, df=grados_libertad)
-
-# Resultado
-print("Media muestral:", round(media_muestral, 2))
-print("Desviación estándar muestral:", round(desv_std_muestral, 2))
-print("Error estándar:", round(error_estandar, 2))
-print("Estadístico t:", round(t_stat, 2))
-print("Valor crítico t:", round(valor_critico, 3))
-
-# Decisión
-if abs(t_stat) > valor_critico:
-    print("Conclusión: Se rechaza la hipótesis nula. La duración de la batería es significativamente diferente de 6 horas.")
-else:
-    print("Conclusión: No se rechaza la hipótesis nula. No hay evidencia suficiente para afirmar que la duración de la batería sea diferente de 6 horas.")
+
+def one_sample_t(n: int, mean: float, std: float, mu0: float, confidence: float = 0.95) -> dict:
+    """Prueba t bilateral de una muestra a partir de n, media y desviación estándar"""
+    from scipy import stats
+
+    standard_error = std / np.sqrt(n)
+    t = (mean - mu0) / standard_error
+    # Valor crítico para prueba bilateral
+    critical = stats.t.ppf(1 - (1 - confidence) / 2, df=n - 1)
+    return {
+        "n": n,
+        "media": float(mean),
+        "std": float(std),
+        "error_estandar": float(standard_error),
+        "t": float(t),
+        "valor_critico": float(critical),
+        "rechaza": bool(abs(t) > critical)
+    }
+
+
+def sample_test(values, mu0: float, confidence: float = 0.95) -> dict:
+    values = np.asarray(values, dtype=np.float64)
+    return one_sample_t(len(values), values.mean(), values.std(ddof=1), mu0, confidence)
+
+
+def file_test(path: str, column: str, mu0: float, confidence: float = 0.95,
+              chunk_rows: int = 1_000_000, sequential: bool = False,
+              on_block: Optional[Callable[[dict], None]] = None) -> dict:
+    """Prueba t de una columna de un archivo grande, leída por bloques con memoria acotada
+
+    on_block recibe el estado de la prueba secuencial tras cada bloque; con
+    sequential se deja de leer en cuanto el valor p siempre válido es significativo.
+    """
+    from cargador import iter_columns
+    from pruebas_t import SequentialTTest
+
+    test = SequentialTTest(mu0, 1 - confidence, confidence=confidence)
+    for chunk in iter_columns(path, [column], chunk_rows=chunk_rows):
+        state = test.update(chunk[column])
+        if on_block:
+            on_block(state)
+        if sequential and state["rechaza"]:
+            break
+
+    return one_sample_t(test.a.n, test.a.mean, np.sqrt(test.a.variance), mu0, confidence)
+
+
+def print_block(estado: dict):
+    print(f"Bloque {estado['lotes']}: n = {estado['n']}, t = {estado['t']:.3f}, "
+          f"p = {estado['p']:.4g}, p siempre válido = {estado['p_siempre_valido']:.4g}")
+    if estado["rechaza"]:
+        print("Detención temprana: el valor p siempre válido cruzó el nivel de significancia.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Prueba t de una muestra (duración de batería)")
+    parser.add_argument("archivo", nargs="?", help="CSV o Parquet con los datos (se lee por bloques)")
+    parser.add_argument("--columna", default="duracion", help="Columna a analizar")
+    parser.add_argument("--media", type=float, default=6.0, help="Media poblacional esperada")
+    parser.add_argument("--confianza", type=float, default=0.95, help="Nivel de confianza")
+    parser.add_argument("--bootstrap", type=int, default=0,
+                        help="Remuestreos para el intervalo BCa de la diferencia de medias (0 = no calcular)")
+    parser.add_argument("--permutaciones", type=int, default=0,
+                        help="Cambios de signo para la prueba de permutación sin normalidad (0 = no calcular)")
+    parser.add_argument("--procesos", type=int, default=None, help="Procesos para el bootstrap y las permutaciones")
+    parser.add_argument("--secuencial", action="store_true",
+                        help="Informar la prueba tras cada bloque y detener si ya es significativa")
+    parser.add_argument("--bloque", type=int, default=1_000_000, help="Filas por bloque del archivo")
+    args = parser.parse_args(argv)
+
+    # Parámetro poblacional
+    media_esperada = args.media
+    nivel_confianza = args.confianza
+
+    if args.archivo:
+        resultado = file_test(args.archivo, args.columna, media_esperada, nivel_confianza,
+                              args.bloque, args.secuencial, print_block if args.secuencial else None)
+    else:
+        resultado = sample_test(DURACIONES, media_esperada, nivel_confianza)
+
+    # Resultado
+    print("Media muestral:", round(resultado["media"], 2))
+    print("Desviación estándar muestral:", round(resultado["std"], 2))
+    print("Error estándar:", round(resultado["error_estandar"], 2))
+    print("Estadístico t:", round(resultado["t"], 2))
+    print("Valor crítico t:", round(resultado["valor_critico"], 3))
+
+    # Intervalo bootstrap de la diferencia media muestral - media esperada
+    if args.bootstrap:
+        if args.archivo:
+            print("El bootstrap necesita los datos en memoria; se omite para archivos.")
+        else:
+            from bootstrap import mean_ci
+
+            ic = mean_ci(DURACIONES, n_resamples=args.bootstrap, confidence=nivel_confianza,
+                         workers=args.procesos, seed=0)
+            print(f"IC bootstrap de la diferencia de medias: "
+                  f"[{ic['low'] - media_esperada:.3f}, {ic['high'] - media_esperada:.3f}]")
+
+    # Alternativa sin supuesto de normalidad: prueba de permutación por cambios de signo
+    if args.permutaciones:
+        if args.archivo:
+            print("La prueba de permutación necesita los datos en memoria; se omite para archivos.")
+        else:
+            from permutacion import sign_flip_test
+
+            permutacion = sign_flip_test(DURACIONES, media_esperada, args.permutaciones,
+                                         workers=args.procesos, seed=0)
+            print(f"Valor p por permutación ({args.permutaciones} cambios de signo): "
+                  f"{permutacion['p']:.4f}")
+
+    # Decisión
+    if resultado["rechaza"]:
+        print(f"Conclusión: Se rechaza la hipótesis nula. La duración de la batería es significativamente diferente de {media_esperada:g} horas.")
+    else:
+        print(f"Conclusión: No se rechaza la hipótesis nula. No hay evidencia suficiente para afirmar que la duración de la batería sea diferente de {media_esperada:g} horas.")
+
+
+if __name__ == "__main__":
+    main()
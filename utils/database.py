@@ -3,10 +3,14 @@
 import sqlite3
 import json
 import csv
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
 from typing import List, Tuple, Any
 
+# Filas por executemany al importar un CSV
+IMPORT_BATCH_SIZE = 10000
+
 
 class MiniDatabase:
     def __init__(self, db_name="minidb.db"):
@@ -188,16 +192,44 @@ class MiniDatabase:
             print(f"Error al exportar: {e}")
             return False
 
-    def import_from_csv(self, table_name, filename):
+    def import_from_csv(self, table_name, filename, batch_size=IMPORT_BATCH_SIZE, progress=None):
+        """Importa un CSV en lotes de executemany dentro de una sola transaccion
+
+        Las filas se leen en streaming; si algo falla no queda nada importado.
+        progress, si se indica, recibe el numero de filas importadas tras cada lote.
+        """
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
+            with open(filename, 'r', newline='', encoding='utf-8') as f:
                 reader = csv.reader(f)
                 headers = next(reader)
 
-                for row in reader:
-                    self.insert_data(table_name, row)
-
-            print(f"Datos importados desde '{filename}'")
+                placeholders = ", ".join(["?" for _ in headers])
+                query = f"INSERT INTO {table_name} VALUES ({placeholders})"
+                total = 0
+
+                def rows():
+                    for row in reader:
+                        # csv.reader devuelve [] para las lineas en blanco
+                        if not row:
+                            continue
+                        if len(row) != len(headers):
+                            raise ValueError(f"la fila de la linea {reader.line_num} tiene "
+                                             f"{len(row)} columnas y se esperaban {len(headers)}")
+                        yield row
+
+                # with self.conn: commit al final o rollback si hay un error
+                with self.conn:
+                    data = rows()
+                    while True:
+                        batch = list(islice(data, batch_size))
+                        if not batch:
+                            break
+                        self.cursor.executemany(query, batch)
+                        total += len(batch)
+                        if progress:
+                            progress(total)
+
+            print(f"Datos importados desde '{filename}' ({total} filas)")
             return True
         except Exception as e:
             print(f"Error al importar: {e}")
@@ -385,7 +417,9 @@ def main():
         elif choice == '12':
             table_name = input("\nNombre de la tabla: ").strip()
             filename = input("Nombre del archivo CSV: ").strip()
-            db.import_from_csv(table_name, filename)
+            db.import_from_csv(table_name, filename,
+                               progress=lambda rows: print(f"\r  {rows} filas...", end="", flush=True))
+            print()
 
         elif choice == '13':
             table_name = input("\nNombre de la tabla: ").strip()